@@ -2,7 +2,9 @@
 """ИИ для класса лекаря, ориентированный на поддержку и лечение."""
 
 import random
-from typing import TYPE_CHECKING, Iterable, List, Tuple, Final
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Pattern, Tuple, Final
 from game.ai.ai_decision_maker import AIDecisionMaker
 
 if TYPE_CHECKING:
@@ -28,6 +30,39 @@ HEAL_POTENTIAL_KEYWORDS: Final[dict[str, int]] = {
 }
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> Pattern[str]:
+    """Одно регулярное выражение, находящее любое из ключевых слов."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Списки ключевых слов компилируются один раз при импорте модуля
+_DAMAGE_ABILITY_PATTERN: Final[Pattern[str]] = _keyword_pattern(DAMAGE_ABILITY_KEYWORDS)
+_HEAL_ABILITY_PATTERN: Final[Pattern[str]] = _keyword_pattern(HEAL_ABILITY_KEYWORDS)
+_STRONG_ATTACK_PATTERN: Final[Pattern[str]] = _keyword_pattern(STRONG_ATTACK_KEYWORDS)
+
+
+@lru_cache(maxsize=None)
+def _classify_ability(ability_name: str) -> Tuple[bool, bool, bool]:
+    """
+    Классификация способности по ключевым словам в названии.
+
+    Набор способностей невелик и не меняется, поэтому результат для каждого
+    названия вычисляется один раз и переиспользуется на всех ходах.
+
+    Args:
+        ability_name: Название способности.
+
+    Returns:
+        Кортеж (атакующая, лечебная, сильная атака).
+    """
+    name = ability_name.lower()
+    return (
+        _DAMAGE_ABILITY_PATTERN.search(name) is not None,
+        _HEAL_ABILITY_PATTERN.search(name) is not None,
+        _STRONG_ATTACK_PATTERN.search(name) is not None,
+    )
+
+
 class HealerAI(AIDecisionMaker):
     """ИИ для игрока-лекаря, использующий систему приоритетов, ориентированную на поддержку."""
 
@@ -177,15 +212,15 @@ class HealerAI(AIDecisionMaker):
 
     def _is_damage_ability(self, ability_name: str) -> bool:
         """Проверяет, является ли способность атакующей."""
-        return any(keyword in ability_name.lower() for keyword in DAMAGE_ABILITY_KEYWORDS)
+        return _classify_ability(ability_name)[0]
 
     def _is_heal_ability(self, ability_name: str) -> bool:
         """Проверяет, является ли способность лечебной."""
-        return any(keyword in ability_name.lower() for keyword in HEAL_ABILITY_KEYWORDS)
+        return _classify_ability(ability_name)[1]
 
     def _is_strong_attack(self, ability_name: str) -> bool:
         """Проверяет, является ли способность сильной атакой."""
-        return any(keyword in ability_name.lower() for keyword in STRONG_ATTACK_KEYWORDS)
+        return _classify_ability(ability_name)[2]
 
     def _get_heal_potential(self, ability_name: str) -> int:
         """Оценка потенциала лечения способности (для выбора наилучшей)."""
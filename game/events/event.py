@@ -29,6 +29,8 @@ class Event(Generic[TSource]):
     battle_id: Optional[str] = None  # Для группировки событий одного боя
     session_id: Optional[str] = None  # Для группировки событий сессии
 
+    # Сообщение для лога боя. BattleLogController подписан только на типы из
+    # своего _EVENT_TYPES: новый тип события с render_data нужно добавить туда
     render_data: Optional['RenderData'] = None
     
     def __post_init__(self):
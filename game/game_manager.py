@@ -34,8 +34,12 @@ class GameManager:
         self.event_bus = self.context.event_bus
         self.battle_manager = BattleManager(self.context)
         self.encounter_manager = EncounterManager(self)
-        self.player_group: List['Player'] = []
-        self.current_enemies: List['Monster'] = []
+        # Копии составов групп для внешнего кода: создаются один раз и
+        # пересоздаются только при изменении состава (см. свойства ниже)
+        self._player_group_view: Optional[List['Player']] = None
+        self._current_enemies_view: Optional[List['Monster']] = None
+        self.player_group = []
+        self.current_enemies = []
         
         register_reward_handlers(self.context)
 
@@ -75,7 +79,8 @@ class GameManager:
                 level=1
             )
             if player:
-                self.player_group.append(player)
+                self._player_group.append(player)
+        self._player_group_view = None
 
     def _create_initial_enemies(self, game_context: 'GameContext') -> None:
         """Создает начальную группу врагов."""
@@ -97,18 +102,53 @@ class GameManager:
     def start_battle(self) -> None:
         self._start_battle(self.player_group, self.current_enemies)
 
+    @property
+    def player_group(self) -> List['Player']:
+        """Группа игроков. Состав меняется присваиванием нового списка."""
+        return self._player_group
+
+    @player_group.setter
+    def player_group(self, players: List['Player']) -> None:
+        self._player_group = players
+        self._player_group_view = None
+
+    @property
+    def current_enemies(self) -> List['Monster']:
+        """Текущие враги. Состав меняется через create_enemies или присваивание."""
+        return self._current_enemies
+
+    @current_enemies.setter
+    def current_enemies(self, enemies: List['Monster']) -> None:
+        self._current_enemies = enemies
+        self._current_enemies_view = None
+
     def get_player_group(self) -> List['Player']:
-        """Получить текущую группу игроков."""
-        return self.player_group.copy()
+        """
+        Получить текущую группу игроков.
+
+        Копия создается только после изменения состава группы; между
+        изменениями возвращается один и тот же список, который нельзя изменять.
+        """
+        if self._player_group_view is None:
+            self._player_group_view = self._player_group.copy()
+        return self._player_group_view
 
     def get_current_enemies(self) -> List['Monster']:
-        """Получение списка текущих врагов."""
-        return self.current_enemies.copy()
+        """
+        Получение списка текущих врагов.
+
+        Копия создается только после изменения состава врагов; между
+        изменениями возвращается один и тот же список, который нельзя изменять.
+        """
+        if self._current_enemies_view is None:
+            self._current_enemies_view = self._current_enemies.copy()
+        return self._current_enemies_view
 
     def create_enemies(self, enemy_data_list: List[Dict[str, Any]], 
         game_context: 'GameContext') -> bool:
         """Создание новой группы врагов."""
-        self.current_enemies.clear()
+        self._current_enemies.clear()
+        self._current_enemies_view = None
         
         from game.factories.monster_factory import MonsterFactory
 
@@ -122,7 +162,7 @@ class GameManager:
                 level=level
             )
             if monster:
-                self.current_enemies.append(monster)
+                self._current_enemies.append(monster)
         
         return True
 
@@ -28,13 +28,22 @@ class HeaderMixin:
     def render_header(self: LayoutProtocol, title: str) -> None:
         """
         Отрисовка стандартной шапки экрана.
+
+        Элементы шапки создаются один раз и переиспользуются,
+        пока не изменятся заголовок или ширина экрана.
         """
         renderer = getattr(self, 'renderer')
-        title_x = max(0, (renderer.width - len(title)) // 2)
-        header_text = Text(title, title_x, 0, bold=True, color=Color.CYAN)
+        cache_key = (title, renderer.width)
+        header_cache = getattr(self, '_header_cache', None)
+        if header_cache is None or header_cache[0] != cache_key:
+            title_x = max(0, (renderer.width - len(title)) // 2)
+            header_text = Text(title, title_x, 0, bold=True, color=Color.CYAN)
+            header_separator = Separator(1, color=Color.DEFAULT)
+            header_cache = (cache_key, header_text, header_separator)
+            setattr(self, '_header_cache', header_cache)
+
+        _, header_text, header_separator = header_cache
         header_text.render(renderer)
-
-        header_separator = Separator(1, color=Color.DEFAULT)
         header_separator.render(renderer)
 
 
@@ -44,19 +53,29 @@ class FooterMixin:
     def render_footer(self: LayoutProtocol) -> None:
         """
         Отрисовка стандартного подвала экрана.
+
+        Разделитель и отрисовщик команд переиспользуются, пока не изменится
+        высота экрана; отрисовщик сам кэширует элементы строки подсказок.
         """
         command_registry = getattr(self, 'command_registry')
         renderer = getattr(self, 'renderer')
-        commands = command_registry.get_all_commands()
-
-        footer_separator_y = max(0, renderer.height - 2)
-        commands_y = max(0, renderer.height - 1)
 
-        footer_separator = Separator(footer_separator_y, color=Color.GRAY)
+        footer_cache = getattr(self, '_footer_cache', None)
+        if footer_cache is None or footer_cache[0] != renderer.height:
+            footer_separator_y = max(0, renderer.height - 2)
+            commands_y = max(0, renderer.height - 1)
+            footer_cache = (
+                renderer.height,
+                Separator(footer_separator_y, color=Color.GRAY),
+                CommandRenderer(y=commands_y)
+            )
+            setattr(self, '_footer_cache', footer_cache)
+
+        _, footer_separator, footer_command_renderer = footer_cache
         footer_separator.render(renderer)
 
-        footer_command_renderer = CommandRenderer(y=commands_y)
-        command_elements = footer_command_renderer.render_commands(commands)
+        # Реестр отдает кэшированную строку подсказок вместо копии списка команд
+        command_elements = footer_command_renderer.render_commands(command_registry)
         for element in command_elements:
             element.render(renderer)
 
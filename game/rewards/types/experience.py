@@ -2,12 +2,26 @@
 """Награда в виде опыта."""
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 from game.rewards.reward import Reward
 
 if TYPE_CHECKING:
     from game.entities.character import Character
 
+
+def _validate_amount(amount: int) -> None:
+    """
+    Проверяет количество опыта награды.
+
+    Args:
+        amount (int): Количество опыта.
+
+    Raises:
+        ValueError: Если количество опыта отрицательное.
+    """
+    if amount < 0:
+        raise ValueError("Количество опыта не может быть отрицательным.")
+
 @dataclass
 class ExperienceReward(Reward):
     """
@@ -22,8 +36,7 @@ class ExperienceReward(Reward):
 
     def __post_init__(self):
         """Пост-инициализация для валидации."""
-        if self.amount < 0:
-            raise ValueError("Количество опыта не может быть отрицательным.")
+        _validate_amount(self.amount)
 
     def apply(self, recipient: 'Character') -> None:
         """
@@ -43,6 +56,38 @@ class ExperienceReward(Reward):
         )
         recipient.context.event_bus.publish(event)
 
+    @classmethod
+    def apply_many(cls, pairs: Iterable[Tuple['Character', int]], source_level: Optional[int] = None) -> None:
+        """
+        Применяет награды опытом к нескольким персонажам за один проход.
+
+        Эквивалентно вызову `ExperienceReward(amount, source_level).apply(character)`
+        для каждой пары, но без создания промежуточных объектов наград.
+        Событие публикуется для каждого персонажа отдельно, так как свойства опыта
+        подписаны на события от конкретного персонажа. Все пары проверяются до
+        публикации первого события: при ошибке опыт не получает никто.
+
+        Args:
+            pairs (Iterable[Tuple[Character, int]]): Пары (персонаж, количество опыта).
+            source_level (Optional[int]): Уровень источника опыта.
+
+        Raises:
+            ValueError: Если количество опыта хотя бы в одной паре отрицательное.
+        """
+        from game.events.reward_events import RewardExperienceGainedEvent
+
+        events = []
+        for recipient, amount in pairs:
+            _validate_amount(amount)
+            events.append(RewardExperienceGainedEvent(
+                source=recipient,
+                amount=amount,
+                source_level=source_level
+            ))
+
+        for event in events:
+            event.source.context.event_bus.publish(event)
+
     def __str__(self) -> str:
         level_info = f" (уровень источника: {self.source_level})" if self.source_level else ""
         return f"ExperienceReward({self.amount} XP{level_info})"
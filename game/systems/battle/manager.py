@@ -163,6 +163,10 @@ class BattleManager:
             return "ongoing"
 
     def setup_battle_log_controller(self, event_bus: 'EventBus', battle_log: 'BattleLog') -> None:
+        # Прежний контроллер отписывается от шины: иначе его подписка и старый лог
+        # со всеми сообщениями остаются в памяти до конца игры
+        if self._battle_log_controller:
+            self._battle_log_controller.deactivate()
         self._battle_log_controller = BattleLogController(
             event_bus=event_bus, 
             battle_log=battle_log
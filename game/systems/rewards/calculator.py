@@ -1,8 +1,10 @@
 # game/systems/rewards/calculator.py
 """Калькулятор и распределитель наград."""
 
+import array
 import random
-from typing import List, TYPE_CHECKING, Sequence
+from itertools import chain
+from typing import Iterable, List, TYPE_CHECKING, Sequence, Tuple
 
 from game.systems.battle.result import BattleResult
 
@@ -23,6 +25,11 @@ if TYPE_CHECKING:
     from game.entities.character import Character
     from game.core.game_context import GameContext
 
+# Стили замен (цвет, жирный, тусклый) для сообщения об опыте группы.
+# Общие кортежи переиспользуются вместо создания новых на каждую замену.
+EXP_VALUE_STYLE: Tuple[Color, bool, bool] = (Color.YELLOW, True, False)  # Желтый, жирный
+EXP_NAME_STYLE: Tuple[Color, bool, bool] = (Color.GREEN, False, False)  # Зеленый
+
 class RewardCalculator:
     """
     Сервис для расчета и распределения наград после боя.
@@ -36,6 +43,8 @@ class RewardCalculator:
             context (GameContext): Игровой контекст для доступа к event_bus и другим сервисам.
         """
         self.context = context
+        # Заранее связанный метод публикации, чтобы не искать его при каждой раздаче наград
+        self._publish = context.event_bus.publish if context else None
 
     def calculate_and_distribute(self, battle_result: BattleResult) -> None:
         """
@@ -48,7 +57,7 @@ class RewardCalculator:
             return
 
         # 1. Собрать все награды от побежденных врагов
-        all_rewards: List[Reward] = []
+        reward_batches: List[Iterable[Reward]] = []
         for enemy in battle_result.dead_enemies:
             # ВРЕМЕННОЕ РЕШЕНИЕ: создаем источник на лету из данных монстра
             # Это потребует, чтобы у Monster были атрибуты reward_exp и т.д.
@@ -67,8 +76,10 @@ class RewardCalculator:
                 base_experience=base_exp,
                 level=enemy_level
             )
-            # Получаем награды от источника и добавляем их в общий список
-            all_rewards.extend(enemy_reward_source.get_rewards())
+            # Получаем награды от источника; общий список собирается один раз ниже
+            reward_batches.append(enemy_reward_source.get_rewards())
+
+        all_rewards: List[Reward] = list(chain.from_iterable(reward_batches))
 
         # 2. Обработать награды
         # Разделяем награды по типам для специальной обработки
@@ -109,8 +120,8 @@ class RewardCalculator:
             total_exp (int): Общее количество опыта для распределения.
             recipients (List[Character]): Список персонажей, получающих опыт.
         """
-        # --- НОВОЕ: Словарь для сбора информации о распределении ---
-        distribution_info: dict['Character', int] = {}
+        # --- НОВОЕ: Список (персонаж, опыт) для сбора информации о распределении ---
+        recipients_and_amounts: List[Tuple['Character', int]] = []
         # --- ---
         
         if len(recipients) == 0:
@@ -121,78 +132,72 @@ class RewardCalculator:
         # Остаток опыта, который нужно распределить
         remainder_exp = total_exp % len(recipients)
 
-        # Создаем список для хранения финального опыта каждого игрока
-        final_exp_distribution = [base_exp_per_player] * len(recipients)
+        # Создаем массив целых чисел для хранения финального опыта каждого игрока
+        final_exp_distribution = array.array('l', [base_exp_per_player]) * len(recipients)
 
         # Распределяем остаток: добавляем 1 очко оставшимся игрокам
         for i in range(remainder_exp):
             final_exp_distribution[i] += 1
 
         # Применяем небольшой случайный разброс (±10%)
-        # Для этого перераспределяем небольшую часть опыта
-        total_to_redistribute = 0
-        redistribution_indices = []
-        
-        for i in range(len(recipients)):
-            # Определяем 10% от базового опыта игрока (минимум 1)
-            ten_percent = max(1, int(final_exp_distribution[i] * 0.1))
-            if ten_percent > 0 and final_exp_distribution[i] > ten_percent:
-                # Выбираем случайное количество для перераспределения (до 10%)
-                redistribute_amount = random.randint(0, ten_percent)
-                if redistribute_amount > 0:
-                    final_exp_distribution[i] -= redistribute_amount
-                    total_to_redistribute += redistribute_amount
-                    redistribution_indices.append(i)
+        # Для этого перераспределяем небольшую часть опыта.
+        # Участвуют только игроки, у которых опыта больше, чем 10% (минимум 1)
+        pool = [
+            i for i, exp in enumerate(final_exp_distribution)
+            if max(1, exp // 10) < exp
+        ]
+        # Выбираем случайное количество для перераспределения (до 10% включительно).
+        # randrange(n + 1) эквивалентен randint(0, n), но без лишнего уровня вызова
+        randrange = random.randrange
+        deltas = [randrange(max(1, final_exp_distribution[i] // 10) + 1) for i in pool]
+        for i, delta in zip(pool, deltas):
+            final_exp_distribution[i] -= delta
+        total_to_redistribute = sum(deltas)
 
         # Распределяем "украденный" опыт случайным образом между всеми игроками
-        if total_to_redistribute > 0 and redistribution_indices:
-            for _ in range(total_to_redistribute):
-                # Выбираем случайного игрока для получения дополнительного опыта
-                recipient_index = random.randint(0, len(recipients) - 1)
+        # одним вызовом random.choices вместо цикла из randint
+        if total_to_redistribute > 0:
+            for recipient_index in random.choices(range(len(recipients)), k=total_to_redistribute):
                 final_exp_distribution[recipient_index] += 1
 
         # 3. Создаем и применяем награды для каждого игрока
-        # --- ИЗМЕНЕНИЕ: Собираем информацию и применяем награду ---
+        # --- ИЗМЕНЕНИЕ: Собираем информацию и применяем награды одним вызовом ---
         for i, player in enumerate(recipients):
             exp_amount = final_exp_distribution[i]
             if exp_amount > 0:
                 # Собираем информацию для агрегированного события
-                distribution_info[player] = exp_amount
-                
-                # Применяем награду (по-прежнему публикуется RewardExperienceGainedEvent)
-                # Это нужно для индивидуальной обработки опыта каждым персонажем
-                source_level = None # TODO: Определить, откуда брать source_level
-                reward = ExperienceReward(amount=exp_amount, source_level=source_level)
-                reward.apply(player) # Это публикует RewardExperienceGainedEvent
-                # print(f"Применена награда: {reward} к {player.name}") # Для отладки
+                recipients_and_amounts.append((player, exp_amount))
+
+        # Применяем награды (по-прежнему публикуется RewardExperienceGainedEvent для каждого)
+        # Это нужно для индивидуальной обработки опыта каждым персонажем
+        source_level = None # TODO: Определить, откуда брать source_level
+        ExperienceReward.apply_many(recipients_and_amounts, source_level=source_level)
         # --- КОНЕЦ ИЗМЕНЕНИЯ ---
 
         # --- НОВОЕ: Создание и публикация агрегированного события ---
-        if distribution_info and self.context: # Убедимся, что есть что публиковать и есть контекст
+        if recipients_and_amounts and self._publish is not None: # Убедимся, что есть что публиковать и есть шина
              # 1. Создаем RenderData с помощью нового метода
-             render_data = self._create_party_exp_render_data(total_exp, distribution_info)
+             render_data = self._create_party_exp_render_data(total_exp, recipients_and_amounts)
 
-             # 2. Преобразуем словарь в список кортежей для события
-             recipients_and_amounts_list = list(distribution_info.items())
-            
-             # 3. Создаем и публикуем событие
+             # 2. Создаем и публикуем событие (список передается без копирования)
              party_event = PartyExperienceGainedEvent(
                  source=None,
-                 recipients_and_amounts=recipients_and_amounts_list,
+                 recipients_and_amounts=recipients_and_amounts,
                  total_experience=total_exp,
                  render_data=render_data
              )
-             self.context.event_bus.publish(party_event)
+             self._publish(party_event)
         # --- КОНЕЦ НОВОГО ---
 
     # --- НОВЫЙ МЕТОД ---
-    def _create_party_exp_render_data(self, total_exp: int, distribution_info: dict['Character', int]) -> 'RenderData':
+    def _create_party_exp_render_data(self, total_exp: int,
+                                      recipients_and_amounts: Sequence[Tuple['Character', int]]) -> 'RenderData':
         """
         Создает RenderData для события PartyExperienceGainedEvent.
 
         Args:
             total_exp (int): Общее количество опыта.
-            distribution_info (dict[Character, int]): Словарь {персонаж: количество опыта}.
+            recipients_and_amounts (Sequence[Tuple[Character, int]]): Пары (персонаж, количество опыта).
 
         Returns:
             RenderData: Объект с шаблоном и заменами для рендеринга сообщения.
@@ -202,22 +207,22 @@ class RewardCalculator:
         replacements = {}
         
         # Добавляем общее количество опыта как первую замену
-        replacements["1"] = (f"{total_exp}", Color.YELLOW, True, False) # Желтый, жирный
+        replacements["1"] = (f"{total_exp}", *EXP_VALUE_STYLE)
         
         # Добавляем детали для каждого персонажа
         char_index = 2 # Начинаем с 2, так как 1 занято общим опытом
         exp_index = 3
         
-        for char, exp in distribution_info.items():
+        for char, exp in recipients_and_amounts:
             char_placeholder = str(char_index)
             exp_placeholder = str(exp_index)
             
             details_parts.append(f"%{char_placeholder}: %{exp_placeholder}")
             
             # Замена для имени персонажа (зеленый)
-            replacements[char_placeholder] = (char.name, Color.GREEN, False, False)
+            replacements[char_placeholder] = (char.name, *EXP_NAME_STYLE)
             # Замена для количества опыта (желтый, жирный)
-            replacements[exp_placeholder] = (f"{exp}", Color.YELLOW, True, False)
+            replacements[exp_placeholder] = (f"{exp}", *EXP_VALUE_STYLE)
             
             char_index += 2 # Переходим к следующему персонажу
             exp_index += 2 # Переходим к следующему опыту
@@ -53,7 +53,7 @@ class BaseScreen(ABC):
 
     def render(self, stdscr: curses.window) -> None:
         """Отрисовка экрана."""
-        self.renderer.clear()
+        self.renderer.erase()
         # Отрисовка основных элементов
         for element in self.elements:
             element.render(self.renderer)
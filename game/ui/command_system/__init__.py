@@ -5,7 +5,7 @@
 Содержит самодостаточные команды и систему их регистрации.
 """
 
-from .command import Command, CommandRegistry
+from .command import Command, CommandRegistry, ScreenContext
 from .screen_command_registry import (
     register_screen_commands,
     get_screen_commands,
@@ -17,6 +17,7 @@ from .command_renderer import CommandRenderer  # ДОБАВИЛИ!
 __all__ = [
     'Command',
     'CommandRegistry',
+    'ScreenContext',
     'CommandRenderer',  # ДОБАВИЛИ!
     'register_screen_commands',
     'get_screen_commands',
@@ -6,18 +6,34 @@
 
 from abc import ABC, abstractmethod
 import curses
-from typing import List, Set, Optional, Any, Union, Callable
+from typing import ClassVar, Dict, FrozenSet, Iterable, List, Optional, Any, Protocol, Union, Callable
 
 # Отложенная аннотация для избежения циклического импорта
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from game.ui.base_screen import BaseScreen
+    from game.ui.screen_manager import ScreenManager
+
+# Разделитель команд в строке подсказок
+COMMAND_SEPARATOR = " | "
+
+
+class ScreenContext(Protocol):
+    """Контекст выполнения команды: экран с доступом к менеджеру экранов."""
+    manager: 'ScreenManager'
 
 
 class Command(ABC):
     """Абстрактная команда."""
 
+    # Может ли команда изменить экран целиком. Команды, меняющие только свой
+    # компонент (например, прокрутка лога), не требуют полной перерисовки экрана
+    redraws_screen: ClassVar[bool] = True
+    # Доступна ли команда во всех состояниях экрана. Такие команды регистрируются
+    # заново, когда экран перестраивает набор команд при смене состояния
+    always_available: ClassVar[bool] = False
+
     def __init__(self, name: str, description: str, keys: List[Union[str, int]], display_key: str = ""):
         """
         Инициализация команды.
@@ -32,11 +48,14 @@ class Command(ABC):
         self.description = description
         self.keys = keys  # Список символов, например ['q', 'ESC']
         self.display_key = display_key if display_key else (str(keys[0]) if keys else "")
+        # Подсказка команды для строки команд, формируется один раз
+        self.display_text = f"{self.display_key} : {self.name}"
+        # Коды клавиш вычисляются один раз: ord работает только со строками, числа берем как есть
+        self._key_codes: FrozenSet[int] = frozenset(key if isinstance(key, int) else ord(key) for key in keys)
 
-    def get_key_codes(self) -> Set[int]:
+    def get_key_codes(self) -> FrozenSet[int]:
         """Получение множества кодов клавиш команды."""
-        # ord работает только со строками, числа возвращаем как есть
-        return {key if isinstance(key, int) else ord(key) for key in self.keys}
+        return self._key_codes
 
     @abstractmethod
     def execute(self, context: Any = None) -> None:
@@ -61,12 +80,35 @@ class LambdaCommand(Command):
         self.action(context)
 
 
+def format_command_line(commands: Iterable[Command]) -> str:
+    """
+    Формирует строку подсказок вида "key : название | key : название".
+
+    Args:
+        commands: Команды для отображения.
+
+    Returns:
+        Строка подсказок (пустая, если команд нет).
+    """
+    return COMMAND_SEPARATOR.join(command.display_text for command in commands)
+
+
+# Размер таблицы прямой адресации команд: покрывает ASCII и стандартные
+# коды клавиш curses (KEY_UP, KEY_DOWN, KEY_ENTER, KEY_RESIZE и т.д.)
+KEY_TABLE_SIZE = 512
+
+
 class CommandRegistry:
     """Реестр команд для экрана."""
 
     def __init__(self) -> None:
         self._commands: List[Command] = []
-        self._key_to_command: dict[int, Command] = {}  # key_code -> command
+        self._key_to_command: Dict[int, Command] = {}  # key_code -> command
+        # Таблица прямой адресации для кодов до KEY_TABLE_SIZE: поиск по индексу
+        # вместо хеширования; остальные коды ищутся в _key_to_command
+        self._key_table: List[Optional[Command]] = [None] * KEY_TABLE_SIZE
+        # Кэш строки подсказок, сбрасывается при изменении набора команд
+        self._display_line: Optional[str] = None
 
     def register_command(self, command: Command) -> None:
         """
@@ -76,9 +118,12 @@ class CommandRegistry:
             command: Команда для регистрации.
         """
         self._commands.append(command)
+        self._display_line = None
         # Регистрируем все клавиши команды
         for key_code in command.get_key_codes():
             self._key_to_command[key_code] = command
+            if 0 <= key_code < KEY_TABLE_SIZE:
+                self._key_table[key_code] = command
 
     def execute_command(self, key_code: int, context: Optional[Any] = None) -> bool:
         """
@@ -91,7 +136,10 @@ class CommandRegistry:
         Returns:
             True если команда найдена и выполнена, False если нет.
         """
-        command = self._key_to_command.get(key_code)
+        if 0 <= key_code < KEY_TABLE_SIZE:
+            command = self._key_table[key_code]
+        else:
+            command = self._key_to_command.get(key_code)
         if command:
             command.execute(context)
             return True
@@ -101,9 +149,21 @@ class CommandRegistry:
         """Получение всех зарегистрированных команд."""
         return self._commands.copy()
 
+    def get_display_line(self) -> str:
+        """Получение строки подсказок для всех команд (кэшируется)."""
+        if self._display_line is None:
+            self._display_line = format_command_line(self._commands)
+        return self._display_line
+
     def get_command_by_key(self, key_code: int) -> Optional[Command]:
         """Получение команды по коду клавиши."""
+        if 0 <= key_code < KEY_TABLE_SIZE:
+            return self._key_table[key_code]
         return self._key_to_command.get(key_code)
 
     def clear(self) -> None:
+        """Удаление всех команд вместе с назначенными им клавишами."""
         self._commands.clear()
+        self._key_to_command.clear()
+        self._key_table = [None] * KEY_TABLE_SIZE
+        self._display_line = None
@@ -4,8 +4,9 @@
 Отдельный класс для отображения информации о доступных командах.
 """
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING, Tuple, Union
 
+from game.ui.command_system.command import CommandRegistry, format_command_line
 from game.ui.rendering.color_manager import Color
 from game.ui.rendering.renderable import Text
 
@@ -28,25 +29,33 @@ class CommandRenderer:
         self.x = x
         self.y = y
         self.max_width = max_width
+        # Последняя отрисованная строка и созданные для нее элементы
+        self._cached: Optional[Tuple[str, List[Text]]] = None
 
-    def render_commands(self, commands: List['Command']) -> List[Text]:
+    def render_commands(self, commands: Union[List['Command'], CommandRegistry]) -> List[Text]:
         """
         Создание элементов отрисовки для команд в одной строке.
         Команды отображаются в формате "key : описание", разделенные " | ".
         Все элементы - тускло серые.
 
         Args:
-            commands: Список команд для отрисовки.
+            commands: Список команд или реестр команд экрана. Для реестра
+                используется его кэшированная строка подсказок.
 
         Returns:
             Список текстовых элементов для отрисовки.
         """
-        if not commands:
+        if isinstance(commands, CommandRegistry):
+            full_line = commands.get_display_line()
+        else:
+            full_line = format_command_line(commands)
+        if not full_line:
             return []
-
-        # Создаем список строк для каждой команды и объединяем их
-        command_strings = [f"{command.display_key} : {command.name}" for command in commands]
-        full_line = " | ".join(command_strings)
+        # Строка не изменилась - возвращаем уже созданные элементы
+        if self._cached is not None and self._cached[0] == full_line:
+            return self._cached[1]
 
         # Возвращаем один текстовый элемент, весь текст будет тускло серым
-        return [Text(full_line, self.x, self.y, dim=True, color=Color.GRAY)]
+        elements = [Text(full_line, self.x, self.y, dim=True, color=Color.GRAY)]
+        self._cached = (full_line, elements)
+        return elements
@@ -4,38 +4,68 @@
 Реализует паттерн Registry для хранения связей между классами экранов и их командами.
 """
 
-from typing import Dict, List, Type, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, List, Tuple, Type, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from game.ui.base_screen import BaseScreen
     from game.ui.command_system.command import Command
 
+# Команда экрана: готовый экземпляр или класс, экземпляр которого создается при первом запросе
+CommandEntry = Union['Command', Type['Command']]
+
 # Глобальный реестр: КлассЭкрана -> СписокКоманд
-SCREEN_COMMANDS: Dict[Type['BaseScreen'], List['Command']] = {}
+SCREEN_COMMANDS: Dict[Type['BaseScreen'], List[CommandEntry]] = {}
 
 
-def register_screen_commands(screen_class: Type['BaseScreen'], commands: List['Command']) -> None:
+def register_screen_commands(screen_class: Type['BaseScreen'], commands: List[CommandEntry]) -> None:
     """
     Регистрация команд для конкретного экрана.
 
+    Повторная регистрация того же набора команд (например, при повторном
+    выполнении модуля команд) ничего не меняет и не сбрасывает кэш выборок.
+
     Args:
         screen_class: Класс экрана.
-        commands: Список команд для этого экрана.
+        commands: Список команд для этого экрана. Классы команд (с конструктором
+            без аргументов) инстанцируются лениво, при первом запросе команд экрана.
     """
+    if SCREEN_COMMANDS.get(screen_class) == commands:
+        return
     SCREEN_COMMANDS[screen_class] = commands
+    # Реестр изменился - сбрасываем кэш выборок
+    get_screen_commands.cache_clear()
+
 
+@lru_cache(maxsize=None)
+def _instantiate(command_class: Type['Command']) -> 'Command':
+    """Создает единственный экземпляр команды для ее класса."""
+    return command_class()
 
+
+@lru_cache(maxsize=None)
 def get_screen_commands(screen_class: Type['BaseScreen']) -> List['Command']:
     """
     Получение команд для конкретного экрана.
 
+    Учитываются и команды, зарегистрированные для базовых классов экрана:
+    команда подкласса с тем же типом и клавишей заменяет команду базового класса.
+    Обход MRO выполняется один раз: результат кэшируется для каждого класса
+    экрана и сбрасывается при любом изменении реестра.
+
     Args:
         screen_class: Класс экрана.
 
     Returns:
         Список команд для экрана (пустой список если нет команд).
     """
-    return SCREEN_COMMANDS.get(screen_class, [])
+    resolved: Dict[Tuple[type, str], 'Command'] = {}
+    # От базовых классов к производным, чтобы команды подкласса имели приоритет
+    for klass in reversed(screen_class.__mro__):
+        for entry in SCREEN_COMMANDS.get(klass, ()):
+            command = _instantiate(entry) if isinstance(entry, type) else entry
+            resolved[(type(command), command.display_key)] = command
+    return list(resolved.values())
 
 
 def get_all_registered_screens() -> List[Type['BaseScreen']]:
@@ -51,3 +81,5 @@ def get_all_registered_screens() -> List[Type['BaseScreen']]:
 def clear_registry() -> None:
     """Очистка реестра (для тестирования)."""
     SCREEN_COMMANDS.clear()
+    get_screen_commands.cache_clear()
+    _instantiate.cache_clear()
@@ -4,11 +4,8 @@
 Содержит реализации команд для конкретных экранов игры.
 """
 
-# ВАЖНО: Импортируем все команды, чтобы они зарегистрировались
-import game.ui.commands.common_commands
-import game.ui.commands.inventory_commands
-import game.ui.commands.battle_commands
-import game.ui.commands.main_screen_commands
+# ВАЖНО: импорт модулей ниже регистрирует их команды для экранов.
+# Каждый модуль импортируется один раз - вместе с экспортом его классов.
 
 # Экспортируем основные классы команд для удобства использования
 # Общие команды
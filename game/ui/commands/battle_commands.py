@@ -3,6 +3,8 @@
 Специфические команды для экрана боя.
 """
 
+import curses
+
 from game.ui.command_system.command import Command
 from game.ui.encounter_screen import EncounterScreen
 from game.ui.command_system.screen_command_registry import register_screen_commands
@@ -60,14 +62,61 @@ class MagicCommand(Command):
             print("Магия!")
 
 
+class ScrollLogUpCommand(Command):
+    """Команда прокрутки лога боя вверх."""
+
+    # Лог сам отмечает себя для перерисовки, если прокрутка что-то изменила
+    redraws_screen = False
+    # Прокрутка лога работает и после окончания боя
+    always_available = True
+
+    def __init__(self):
+        super().__init__(
+            name="Лог вверх",
+            description="Показать более ранние сообщения лога",
+            keys=[curses.KEY_UP],
+            display_key="↑"
+        )
+
+    def execute(self, context: Optional[Any] = None) -> None:
+        """Выполнение команды прокрутки лога вверх."""
+        if context and context.event_log:
+            context.event_log.scroll_up()
+
+
+class ScrollLogDownCommand(Command):
+    """Команда прокрутки лога боя вниз."""
+
+    # Лог сам отмечает себя для перерисовки, если прокрутка что-то изменила
+    redraws_screen = False
+    # Прокрутка лога работает и после окончания боя
+    always_available = True
+
+    def __init__(self):
+        super().__init__(
+            name="Лог вниз",
+            description="Показать более поздние сообщения лога",
+            keys=[curses.KEY_DOWN],
+            display_key="↓"
+        )
+
+    def execute(self, context: Optional[Any] = None) -> None:
+        """Выполнение команды прокрутки лога вниз."""
+        if context and context.event_log:
+            context.event_log.scroll_down()
+
+
 # Импортируем общие команды
 from game.ui.commands.common_commands import GoBackCommand, OpenInventoryCommand
 
 # Регистрируем команды для экрана боя
+# Регистрируются классы: экземпляры создаются при первом открытии экрана
 register_screen_commands(EncounterScreen, [
-    AttackCommand(),
-    DefendCommand(),
-    MagicCommand(),
-    OpenInventoryCommand(),  # Переиспользуем общую команду
-    GoBackCommand()          # Переиспользуем общую команду
+    AttackCommand,
+    DefendCommand,
+    MagicCommand,
+    ScrollLogUpCommand,
+    ScrollLogDownCommand,
+    OpenInventoryCommand,  # Переиспользуем общую команду
+    GoBackCommand          # Переиспользуем общую команду
 ])
\ No newline at end of file
@@ -3,7 +3,7 @@
 
 from typing import Optional, Any
 
-from game.ui.command_system.command import Command
+from game.ui.command_system.command import Command, ScreenContext
 
 
 class GoBackCommand(Command):
@@ -17,10 +17,11 @@ class GoBackCommand(Command):
             display_key="q"
         )
 
-    def execute(self, context: Optional[Any] = None) -> None:
+    def execute(self, context: Optional[ScreenContext] = None) -> None:
         """Выполнение команды возврата."""
-        if context and hasattr(context, 'manager'):
-            context.manager.go_back()
+        if context is None:
+            return
+        context.manager.go_back()
 
 
 class OpenInventoryCommand(Command):
@@ -34,10 +35,11 @@ class OpenInventoryCommand(Command):
             display_key="i"
         )
 
-    def execute(self, context: Optional[Any] = None) -> None:
+    def execute(self, context: Optional[ScreenContext] = None) -> None:
         """Выполнение команды открытия инвентаря."""
-        if context and hasattr(context, 'manager'):
-            context.manager.change_screen("inventory")
+        if context is None:
+            return
+        context.manager.change_screen("inventory")
 
 
 class HelpCommand(Command):
@@ -69,7 +71,8 @@ class ExitCommand(Command):
             display_key="q"
         )
 
-    def execute(self, context: Optional[Any] = None) -> None:
+    def execute(self, context: Optional[ScreenContext] = None) -> None:
         """Выполнение команды выхода."""
-        if context and hasattr(context, 'manager'):
-            context.manager.stop()
+        if context is None:
+            return
+        context.manager.stop()
@@ -48,8 +48,9 @@ class DropItemCommand(Command):
 from game.ui.commands.common_commands import GoBackCommand
 
 # Регистрируем команды для экрана инвентаря
+# Регистрируются классы: экземпляры создаются при первом открытии экрана
 register_screen_commands(InventoryScreen, [
-    UseItemCommand(),
-    DropItemCommand(),
-    GoBackCommand()  # Переиспользуем общую команду
+    UseItemCommand,
+    DropItemCommand,
+    GoBackCommand  # Переиспользуем общую команду
 ])
\ No newline at end of file
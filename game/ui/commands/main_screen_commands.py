@@ -3,7 +3,7 @@
 
 from typing import Optional, Any
 
-from game.ui.command_system.command import Command
+from game.ui.command_system.command import Command, ScreenContext
 from game.ui.command_system.screen_command_registry import register_screen_commands
 # Импортируем общие команды
 from game.ui.commands.common_commands import OpenInventoryCommand, ExitCommand
@@ -22,10 +22,11 @@ class StartEncounterCommand(Command):
             display_key="1"
         )
 
-    def execute(self, context: Optional[Any] = None) -> None:
+    def execute(self, context: Optional[ScreenContext] = None) -> None:
         """Выполнение команды."""
-        if context and hasattr(context, 'manager'):
-            context.manager.change_screen("encounter_selection")
+        if context is None:
+            return
+        context.manager.change_screen("encounter_selection")
 
 
 class OpenSettingsCommand(Command):
@@ -47,9 +48,10 @@ class OpenSettingsCommand(Command):
 
 
 # Регистрируем команды для главного экрана
+# Регистрируются классы: экземпляры создаются при первом открытии экрана
 register_screen_commands(MainScreen, [
-    StartEncounterCommand(),
-    OpenInventoryCommand(),
-    OpenSettingsCommand(),
-    ExitCommand()
+    StartEncounterCommand,
+    OpenInventoryCommand,
+    OpenSettingsCommand,
+    ExitCommand
 ])
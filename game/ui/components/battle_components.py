@@ -3,14 +3,15 @@
 Содержит визуальные элементы для отображения игроков, врагов и лога боя."""
 
 import curses
-from typing import List, TYPE_CHECKING, Optional, Dict
-
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, List, TYPE_CHECKING, Optional, Tuple
 
 from game.ui.rendering.renderable import Renderable
-from game.ui.rendering.renderer import Renderer
 from game.ui.rendering.color_manager import Color
+from game.ui.rendering.template_renderer import clip_spans, join_segments
 # Импортируем новые виджеты
-from game.ui.widgets.labels import CharacterNameLabel, CharacterLevelLabel, CharacterClassLabel, TextLabel
+from game.ui.widgets.labels import CharacterNameLabel, CharacterLevelLabel, CharacterClassLabel
 from game.ui.widgets.bars import HealthBar, EnergyBar
 
 # Импорты для аннотаций типов, чтобы избежать циклических импортов на уровне выполнения
@@ -19,10 +20,61 @@ if TYPE_CHECKING:
     from game.entities.player import Player
     from game.entities.character import Character
     from game.events.render_data import RenderData
+    from game.ui.rendering.renderer import Renderer
+
+PLACEHOLDER_TEXT = "Нет данных"
+
+
+@lru_cache(maxsize=8)
+def _placeholder_line(width: int) -> str:
+    """
+    Строка заглушки панели, дополненная пробелами до ширины панели.
+
+    Ширина панели меняется только при изменении размеров экрана, поэтому
+    строка строится один раз на ширину, а не при каждой отрисовке.
+
+    Args:
+        width: Ширина панели в символах.
+
+    Returns:
+        Текст заглушки длиной ровно width символов.
+    """
+    return PLACEHOLDER_TEXT.ljust(width)[:width]
+
+
+def _read_unit_stats(character: 'Character') -> Tuple[int, int, int, int]:
+    """
+    Чтение здоровья и энергии персонажа, у которого часть свойств может отсутствовать.
+
+    Каждое свойство читается с персонажа один раз; значения по умолчанию
+    совпадают с теми, что используют HealthBar и EnergyBar.
+
+    Args:
+        character: Объект персонажа.
+
+    Returns:
+        Кортеж (HP, максимум HP, энергия, максимум энергии).
+    """
+    health = getattr(character, 'health', None)
+    energy = getattr(character, 'energy', None)
+    if health is None:
+        hp, max_hp = 0, 1
+    else:
+        hp, max_hp = getattr(health, 'health', 0), getattr(health, 'max_health', 1)
+    if energy is None:
+        return hp, max_hp, 0, 0
+    return hp, max_hp, getattr(energy, 'energy', 0), getattr(energy, 'max_energy', 0)
 
 
 class UnitPanel(Renderable):
     """Базовая панель для отображения одного юнита (игрока или врага) в одну строку."""
+
+    __slots__ = (
+        'width', 'height', 'character',
+        'name_label', 'class_label', 'level_label', 'hp_label', 'energy_label',
+        '_direct_snapshot', '_offsets', '_offsets_key', '_widgets_layout_key',
+        '_render_cache_key', '_render_cache_line',
+    )
     
     # Константы для компоновки
     DEFAULT_WIDGET_MAX_WIDTH = 10
@@ -44,6 +96,9 @@ class UnitPanel(Renderable):
     HP_CRITICAL_THRESHOLD = 0.25
     HP_LOW_THRESHOLD = 0.5
 
+    # Атрибуты персонажа, данные которых входят в снимок панели
+    _SNAPSHOT_ATTRIBUTES = ('name', 'class_icon', 'class_icon_color', 'level', 'health', 'energy')
+
     def __init__(self, character: Optional['Character'], x: int, y: int, width: int, height: int) -> None:
         """Инициализация базовой панели юнита.
         Args:
@@ -57,13 +112,7 @@ class UnitPanel(Renderable):
         self.width = width
         self.height = height
         self.character = character
-        
-        if character and getattr(character, 'is_player', False):
-            name_width = self.CHARACTER_NAME_WIDTH 
-            color = Color.GREEN
-        else:
-            name_width = self.MONSTER_NAME_WIDTH
-            color = Color.BLUE
+        name_width, color = self._name_style(character)
 
         # Инициализируем виджеты
         self.name_label = CharacterNameLabel(character=self.character, x=x, y=y, max_width=name_width, color=color)
@@ -72,6 +121,66 @@ class UnitPanel(Renderable):
         
         self.hp_label = HealthBar(character=self.character, x=x, y=y, width=self.HP_BAR_WIDTH)
         self.energy_label = EnergyBar(character=self.character, x=x, y=y, width=self.EP_BAR_WIDTH)
+        # Есть ли у персонажа все свойства, читаемые снимком: проверяется один раз,
+        # чтобы снимок каждого кадра читал атрибуты напрямую
+        self._direct_snapshot = self._has_snapshot_attributes(character)
+        # Смещения виджетов от левого края панели и длины текста меток, для которых они рассчитаны
+        self._offsets: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)
+        self._offsets_key: Optional[Tuple[int, int]] = None
+        # Данные, по которым последний раз рассчитывались позиции виджетов
+        self._widgets_layout_key: Optional[Tuple[int, int, int, int]] = None
+        # Готовая к выводу строка панели: снимок данных и отрезки (x, [(текст, атрибуты)])
+        self._render_cache_key: Optional[Tuple[object, ...]] = None
+        self._render_cache_line: List[Tuple[int, List[Tuple[str, int]]]] = []
+
+    def _name_style(self, character: Optional['Character']) -> Tuple[int, Color]:
+        """Ширина и цвет имени: у игроков и монстров они различаются.
+
+        Args:
+            character: Объект персонажа или None.
+
+        Returns:
+            Кортеж (ширина имени, цвет имени).
+        """
+        if character and getattr(character, 'is_player', False):
+            return self.CHARACTER_NAME_WIDTH, Color.GREEN
+        return self.MONSTER_NAME_WIDTH, Color.BLUE
+
+    def _has_snapshot_attributes(self, character: Optional['Character']) -> bool:
+        """Есть ли у персонажа все свойства, которые снимок читает напрямую."""
+        return character is not None and all(
+            getattr(character, attr, None) is not None for attr in self._SNAPSHOT_ATTRIBUTES
+        )
+
+    def set_character(self, character: Optional['Character']) -> None:
+        """
+        Привязать панель к другому персонажу без пересоздания виджетов.
+
+        Позволяет панели группы переиспользовать панель выбывшего юнита для
+        нового: виджеты перенаправляются на нового персонажа на месте, а
+        кэши строки и расстановки сбрасываются.
+
+        Args:
+            character: Объект персонажа или None.
+        """
+        self.character = character
+        name_width, color = self._name_style(character)
+        self.name_label.character = character
+        self.name_label.max_width = name_width
+        self.name_label.color = color
+        self.class_label.character = character
+        self.level_label.character = character
+        self.hp_label.set_character(character)
+        self.energy_label.set_character(character)
+        self.name_label._update_from_character()
+        self.class_label._update_from_character()
+        self.level_label._update_from_character()
+
+        self._direct_snapshot = self._has_snapshot_attributes(character)
+        self._offsets_key = None
+        self._widgets_layout_key = None
+        self._render_cache_key = None
+        self._render_cache_line = []
 
     def update_size(self, width: int, height: int) -> None:
         """
@@ -91,80 +200,157 @@ class UnitPanel(Renderable):
         """Обновить позиции и размеры виджетов в зависимости от ширины панели."""
         if not self.character:
             return
-            
-        current_x = self.x
-        
-        # 1. Имя
-        self.name_label.x = current_x
-        self.name_label.y = self.y
-        name_width = self.name_label.max_width
-        current_x += name_width + self.WIDGET_SPACING
-
-        # 2. Класс/роль
-        self.class_label.x = current_x
-        self.class_label.y = self.y
+
         # Обновляем текст для расчета ширины
         self.class_label._update_from_character()
-        class_width = len(self.class_label.text) + self.BRAKETS_WIDTH
-        current_x += class_width
-        
-        # 3. Уровень
-        self.level_label.x = current_x
-        self.level_label.y = self.y
-        # Обновляем текст для расчета ширины
         self.level_label._update_from_character()
-        level_width = len(self.level_label.text) + self.BRAKETS_WIDTH
-        current_x += level_width
+        self._place_widgets()
+
+    def _place_widgets(self) -> None:
+        """Расставить виджеты по текущему тексту меток."""
+        text_lengths = (len(self.class_label.text), len(self.level_label.text))
+        # Смещения виджетов от начала панели зависят только от длины текста меток:
+        # при перемещении панели они не пересчитываются
+        if text_lengths != self._offsets_key:
+            self._offsets = self._compute_offsets(*text_lengths)
+            self._offsets_key = text_lengths
+
+        x, y = self.x, self.y
+        name_offset, class_offset, level_offset, hp_offset, energy_offset = self._offsets
+        self.name_label.x, self.name_label.y = x + name_offset, y
+        self.class_label.x, self.class_label.y = x + class_offset, y
+        self.level_label.x, self.level_label.y = x + level_offset, y
+        self.hp_label.x, self.hp_label.y = x + hp_offset, y
+        self.energy_label.x, self.energy_label.y = x + energy_offset, y
+
+        self._widgets_layout_key = (x, y) + text_lengths
+
+    def _compute_offsets(self, class_length: int, level_length: int) -> Tuple[int, int, int, int, int]:
+        """Расчет смещений виджетов от левого края панели.
 
-        # 4. HP
-        self.hp_label.x = current_x
-        self.hp_label.y = self.y
-        current_x += self.hp_label.width + self.BRAKETS_WIDTH
-        
-        # 5. Energy
-        self.energy_label.x = current_x
-        self.energy_label.y = self.y
+        Args:
+            class_length: Длина текста метки класса.
+            level_length: Длина текста метки уровня.
+
+        Returns:
+            Смещения имени, класса, уровня, HP и энергии.
+        """
+        # 1. Имя, 2. Класс/роль, 3. Уровень, 4. HP, 5. Energy
+        class_offset = self.name_label.max_width + self.WIDGET_SPACING
+        level_offset = class_offset + class_length + self.BRAKETS_WIDTH
+        hp_offset = level_offset + level_length + self.BRAKETS_WIDTH
+        energy_offset = hp_offset + self.hp_label.width + self.BRAKETS_WIDTH
+        return 0, class_offset, level_offset, hp_offset, energy_offset
+
+    def snapshot(self) -> Tuple[object, ...]:
+        """
+        Снимок отображаемых данных юнита.
+
+        Используется для определения, изменилось ли что-либо с последней отрисовки.
+        Читает исходные данные персонажа, не обновляя метки: метки обновляются
+        при отрисовке и только если снимок изменился.
 
-    def render(self, renderer: Renderer) -> None:
+        Returns:
+            Кортеж из геометрии панели и данных персонажа, выводимых виджетами.
+        """
+        character = self.character
+        if not character:
+            return (self.x, self.y, self.width)
+
+        if self._direct_snapshot:
+            # Все свойства на месте: прямое чтение атрибутов без getattr со значением по умолчанию
+            health, energy = character.health, character.energy
+            return (
+                self.x, self.y, self.width,
+                character.name, character.class_icon, character.class_icon_color,
+                character.level.level,
+                health.health, health.max_health,
+                energy.energy, energy.max_energy,
+            )
+
+        return (
+            self.x, self.y, self.width,
+            getattr(character, 'name', None),
+            getattr(character, 'class_icon', None), getattr(character, 'class_icon_color', None),
+            getattr(getattr(character, 'level', None), 'level', None),
+        ) + _read_unit_stats(character)
+
+    def render(self, renderer: 'Renderer') -> None:
         """Отрисовка базовой панели юнита в одну строку."""
+        self.render_with_snapshot(renderer, self.snapshot())
+
+    def render_with_snapshot(self, renderer: 'Renderer', render_key: Tuple[object, ...]) -> None:
+        """Отрисовка панели по уже вычисленному снимку данных.
+
+        Позволяет панели группы не строить снимок юнита повторно: он уже
+        вычислен при проверке изменений группы в том же кадре.
+
+        Args:
+            renderer: Рендерер для отрисовки.
+            render_key: Результат snapshot() этой панели.
+        """
         if not self.character:
-            # Если персонаж не установлен, отображаем заглушку
-            placeholder_text = "Нет данных"
-            display_text = placeholder_text.ljust(self.width)[:self.width]
-            try:
-                renderer.draw_text(display_text, self.x, self.y, color=Color.GRAY)
-            except curses.error:
-                pass
+            self._render_placeholder(renderer)
             return
 
-        # Обновляем данные виджетов
-        self.name_label._update_from_character()
-        self.class_label._update_from_character()
-        self.level_label._update_from_character()
-        
-        # Пересчитываем позиции
-        self._update_widgets_positions()
-        
-        # Отрисовываем все виджеты
-        self.name_label.render(renderer)
-        self.class_label.render(renderer)
-        self.level_label.render(renderer)
-        self.hp_label.render(renderer)
-        self.energy_label.render(renderer)
-            
+        # Метки обновляются из персонажа и строка собирается заново только при изменении снимка
+        if render_key != self._render_cache_key:
+            self.name_label._update_from_character()
+            self.class_label._update_from_character()
+            self.level_label._update_from_character()
+            self._render_cache_line = self._compile_line(renderer)
+            self._render_cache_key = render_key
+
+        for x, spans in self._render_cache_line:
+            renderer.draw_spans(spans, x, self.y)
+
+    def _render_placeholder(self, renderer: 'Renderer') -> None:
+        """Отрисовка заглушки, если персонаж не установлен.
+
+        Ошибки выхода за границы экрана обрабатывает сам draw_text.
+        """
+        renderer.draw_text(_placeholder_line(self.width), self.x, self.y, color=Color.GRAY)
+
+    def _compile_line(self, renderer: 'Renderer') -> List[Tuple[int, List[Tuple[str, int]]]]:
+        """Подготовка строки панели к выводу.
+
+        Виджеты не рисуются напрямую: их шаблоны преобразуются в отрезки,
+        которые выводятся без повторного разбора, пока данные юнита не изменятся.
+
+        Args:
+            renderer: Рендерер, преобразующий шаблоны в атрибуты curses.
+
+        Returns:
+            Список пар (координата X, отрезки строки); обычно одна пара на всю строку.
+        """
+        # Позиции пересчитываются только при смене положения панели или ширины меток
+        layout_key = (self.x, self.y, len(self.class_label.text), len(self.level_label.text))
+        if layout_key != self._widgets_layout_key:
+            self._place_widgets()
+
+        name = self.name_label
+        segments = [(name.x, renderer.compile_template(
+            "%1", {"1": (name.text, name.color, name.bold, name.dim)}
+        ))]
+        for widget in (self.class_label, self.level_label, self.hp_label, self.energy_label):
+            segments.append((widget.x, renderer.compile_template(*widget._get_template_and_replacements())))
+
         # Очистка остаточного пространства
         last_widget_end_x = self.energy_label.x + self.energy_label.width + self.BRAKETS_WIDTH
         if last_widget_end_x < self.x + self.width:
             remaining_width = (self.x + self.width) - last_widget_end_x
-            try:
-                renderer.draw_text(" " * remaining_width, last_widget_end_x, self.y)
-            except curses.error:
-                pass
+            segments.append((last_widget_end_x, renderer.compile_template(
+                "%1", {"1": (" " * remaining_width, Color.DEFAULT, False, False)}
+            )))
+        # Виджеты идут слева направо: строка выводится одним вызовом draw_spans
+        return join_segments(segments)
 
 
 class EnemyUnitPanel(UnitPanel):
     """Панель для отображения одного врага."""
 
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, width: int, height: int, monster: Optional['Monster']) -> None:
         """Инициализация панели врага.
         Args:
@@ -180,6 +366,8 @@ class EnemyUnitPanel(UnitPanel):
 class PlayerUnitPanel(UnitPanel):
     """Панель для отображения одного игрока."""
 
+    __slots__ = ()
+
     def __init__(self, x: int, y: int, width: int, height: int, player: Optional['Player']) -> None:
         """Инициализация панели игрока.
         Args:
@@ -195,6 +383,8 @@ class PlayerUnitPanel(UnitPanel):
 class GroupPanel(Renderable):
     """Базовая панель для отображения группы юнитов без внешнего обрамления."""
 
+    __slots__ = ('width', 'height', 'panels', '_panel_pool', '_rendered_snapshot', '_rendered_units')
+
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         """Инициализация базовой панели группы.
         Args:
@@ -208,6 +398,35 @@ class GroupPanel(Renderable):
         self.height = height
         # Этот список будет заполняться в подклассах
         self.panels: List[UnitPanel] = []
+        # Панели выбывших юнитов, которые можно привязать к новым юнитам вместо создания
+        self._panel_pool: List[UnitPanel] = []
+        # Снимок данных на момент последней отрисовки и отдельно снимки юнитов в нем
+        self._rendered_snapshot: Optional[Tuple[object, ...]] = None
+        self._rendered_units: Tuple[Tuple[object, ...], ...] = ()
+
+    @property
+    def dirty(self) -> bool:
+        """Требуется ли перерисовка панели (изменились данные юнитов или геометрия)."""
+        return self._snapshot() != self._rendered_snapshot
+
+    def _snapshot(self, unit_snapshots: Optional[Tuple[Tuple[object, ...], ...]] = None) -> Tuple[object, ...]:
+        """Снимок геометрии панели и данных видимых юнитов.
+
+        Args:
+            unit_snapshots: Уже вычисленные снимки видимых юнитов (вычисляются, если не переданы).
+        """
+        if unit_snapshots is None:
+            unit_snapshots = self._unit_snapshots()
+        return (self.x, self.y, self.width, self.height, unit_snapshots)
+
+    def _unit_snapshots(self) -> Tuple[Tuple[object, ...], ...]:
+        """Снимки данных видимых юнитов."""
+        panels = self.panels
+        return tuple(panels[i].snapshot() for i in range(self._visible_count()))
+
+    def _visible_count(self) -> int:
+        """Количество панелей юнитов, помещающихся в высоту панели группы (по строке на юнит)."""
+        return min(len(self.panels), self.height)
 
     def update_size(self, max_width: int, max_height: int) -> None:
         """
@@ -219,24 +438,129 @@ class GroupPanel(Renderable):
         # Обновление размеров дочерних панелей
         if self.panels:
             # Рассчитываем ширину для каждой панели
-            panel_count = len(self.panels)
-            new_panel_width = max(10, self.width // panel_count) if panel_count > 0 else self.width
+            new_panel_width = max(10, self.width // len(self.panels))
+
+            for panel in self.panels:
+                # Панели уже нужного размера не трогаем: пересчет позиций виджетов
+                # и сброс их кэша строки нужен только при фактическом изменении
+                if panel.width != new_panel_width or panel.height != 1:
+                    panel.update_size(new_panel_width, 1)  # Высота панели юнита должна быть 1
+
+    def _update_panels(self) -> None:
+        """Обновление списка панелей юнитов (реализуется в подклассах)."""
+        pass
+
+    def _rebuild_panels(self, units: List['Character'],
+                        panel_factory: Callable[[int, int, int, int, 'Character'], UnitPanel]) -> None:
+        """Перестроение списка панелей по списку юнитов.
 
-            for i, panel in enumerate(self.panels):
-                panel.width = new_panel_width
-                panel.height = 1  # Высота панели юнита должна быть 1
-                panel.update_size(new_panel_width, 1)  # Обновляем размеры внутренних виджетов
+        Панели юнитов, оставшихся в группе, переиспользуются и только
+        перемещаются на свою строку. Новые юниты получают панели выбывших
+        (из пула группы), и лишь когда пул пуст, панели создаются заново.
 
-    def render(self, renderer: Renderer) -> None:
+        Args:
+            units: Юниты группы в порядке отображения.
+            panel_factory: Конструктор панели (x, y, ширина, высота, юнит).
+        """
+        existing = {id(panel.character): panel for panel in self.panels}
+        kept = [existing.pop(id(unit), None) for unit in units]
+
+        # Панели выбывших юнитов отвязываются от них и уходят в пул
+        pool = self._panel_pool
+        for panel in existing.values():
+            panel.set_character(None)
+            pool.append(panel)
+
+        panels: List[UnitPanel] = []
+        # Каждая панель размещается на отдельной строке: координаты строк идут подряд
+        x, width = self.x, self.width
+        for panel_y, unit, panel in zip(range(self.y, self.y + len(units)), units, kept):
+            if panel is None and pool:
+                panel = pool.pop()
+                panel.set_character(unit)
+            if panel is None:
+                panel = panel_factory(x, panel_y, width, 1, unit)
+            else:
+                panel.x, panel.y, panel.width = x, panel_y, width
+            panels.append(panel)
+        self.panels = panels
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> bool:
+        """Устанавливает положение и размеры панели одним вызовом.
+
+        Панели юнитов перестраиваются только при фактическом изменении геометрии.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+            width: Ширина панели.
+            height: Высота панели.
+
+        Returns:
+            True, если геометрия изменилась.
+        """
+        if (self.x, self.y, self.width, self.height) == (x, y, width, height):
+            return False
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self._update_panels()
+        return True
+
+    @staticmethod
+    def _has_same_units(current: List['Character'], new: List['Character']) -> bool:
+        """Проверяет, что новый список содержит тех же персонажей в том же порядке.
+
+        Args:
+            current: Текущий список персонажей панели.
+            new: Новый список персонажей.
+
+        Returns:
+            True, если состав группы не изменился и панели можно не пересоздавать.
+        """
+        return len(current) == len(new) and all(old is unit for old, unit in zip(current, new))
+
+    def render(self, renderer: 'Renderer') -> None:
         """Отрисовка панели группы без внешнего обрамления."""
-        # Отрисовка каждой панели юнита
-        for panel in self.panels:
-            panel.render(renderer)
+        unit_snapshots = self._unit_snapshots()
+        self._rendered_units = unit_snapshots
+        self._rendered_snapshot = self._snapshot(unit_snapshots)
+        # Отрисовка панелей юнитов, помещающихся в панель группы, по их снимкам
+        # из снимка группы: данные каждого юнита читаются за кадр один раз
+        for panel, unit_snapshot in zip(self.panels, unit_snapshots):
+            panel.render_with_snapshot(renderer, unit_snapshot)
+
+    def render_changed(self, renderer: 'Renderer') -> None:
+        """Перерисовка только тех строк юнитов, данные которых изменились с последней отрисовки.
+
+        Строки остальных юнитов остаются на экране. Если изменилась геометрия
+        группы или число видимых юнитов, область очищается и отрисовывается целиком.
+
+        Args:
+            renderer: Рендерер для отрисовки.
+        """
+        unit_snapshots = self._unit_snapshots()
+        rendered = self._rendered_snapshot
+        if (rendered is None or rendered[:4] != (self.x, self.y, self.width, self.height)
+                or len(self._rendered_units) != len(unit_snapshots)):
+            renderer.clear_region(self.x, self.y, self.width, self.height)
+            self.render(renderer)
+            return
+        if unit_snapshots == self._rendered_units:
+            # Ни один юнит не изменился: строки на экране актуальны
+            return
+
+        for panel, unit_snapshot, rendered_unit in zip(self.panels, unit_snapshots, self._rendered_units):
+            if unit_snapshot != rendered_unit:
+                renderer.clear_region(self.x, panel.y, self.width, 1)
+                panel.render_with_snapshot(renderer, unit_snapshot)
+        self._rendered_units = unit_snapshots
+        self._rendered_snapshot = self._snapshot(unit_snapshots)
 
 
 class EnemyGroupPanel(GroupPanel):
     """Панель для отображения группы врагов."""
 
+    __slots__ = ('enemies',)
+
     def __init__(self, x: int, y: int, width: int, height: int, enemies: List['Monster']) -> None:
         """Инициализация панели группы врагов.
         Args:
@@ -255,32 +579,31 @@ class EnemyGroupPanel(GroupPanel):
 
     def _update_panels(self) -> None:
         """Обновление списка панелей на основе объектов врагов."""
-        self.panels = []
-        
-        for i, monster in enumerate(self.enemies):
-            # Каждая панель размещается на отдельной строке
-            panel_x = self.x
-            panel_y = self.y + i  # Одна строка на панель
-            panel_width = self.width
-            panel_height = 1  # Фиксированная высота 1 строка
-            
-            # Создаем панель, передавая объект Monster
-            panel = EnemyUnitPanel(panel_x, panel_y, panel_width, panel_height, monster)
-            self.panels.append(panel)
-
-    def update_enemies(self, enemies: List['Monster']) -> None:
+        self._rebuild_panels(self.enemies, EnemyUnitPanel)
+
+    def update_enemies(self, enemies: List['Monster']) -> bool:
         """Обновляет список врагов и пересоздает панели.
         
+        Если состав группы не изменился, панели не пересоздаются.
+
         Args:
             enemies: Новый список объектов Monster для отображения.
+
+        Returns:
+            True, если панели были перестроены.
         """
+        same_units = self._has_same_units(self.enemies, enemies)
         self.enemies = enemies
-        self._update_panels()
+        if not same_units:
+            self._update_panels()
+        return not same_units
 
 
 class PlayerGroupPanel(GroupPanel):
     """Панель для отображения группы игроков."""
 
+    __slots__ = ('players',)
+
     def __init__(self, x: int, y: int, width: int, height: int, players: List['Player']) -> None:
         """Инициализация панели группы игроков.
         Args:
@@ -299,38 +622,105 @@ class PlayerGroupPanel(GroupPanel):
 
     def _update_panels(self) -> None:
         """Обновление списка панелей на основе объектов игроков."""
-        self.panels = []
-        
-        for i, player in enumerate(self.players):
-            # Каждая панель размещается на отдельной строке
-            panel_x = self.x
-            panel_y = self.y + i  # Одна строка на панель
-            panel_width = self.width
-            panel_height = 1  # Фиксированная высота 1 строка
-            
-            # Создаем панель, передавая объект Player
-            panel = PlayerUnitPanel(panel_x, panel_y, panel_width, panel_height, player)
-            self.panels.append(panel)
-
-    def update_players(self, players: List['Player']) -> None:
+        self._rebuild_panels(self.players, PlayerUnitPanel)
+
+    def update_players(self, players: List['Player']) -> bool:
         """Обновляет список игроков и пересоздает панели.
         
+        Если состав группы не изменился, панели не пересоздаются.
+
         Args:
             players: Новый список объектов Player для отображения.
+
+        Returns:
+            True, если панели были перестроены.
         """
+        same_units = self._has_same_units(self.players, players)
         self.players = players
-        self._update_panels()
+        if not same_units:
+            self._update_panels()
+        return not same_units
 
 
 class BattleLog(Renderable):
     """Лог боя в нижней части экрана с прокруткой и обрамлением."""
 
+    __slots__ = (
+        'width', 'height', 'messages', '_compiled_lines', '_compiled_width', 'scroll_offset',
+        '_dirty', '_rendered_geometry', '_scroll_delta', '_appended', '_visible_start', '_visible_lines',
+    )
+
+    # Сколько последних сообщений хранит лог: более старые вытесняются
+    MAX_MESSAGES = 500
+
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         super().__init__(x, y)
         self.width = width
         self.height = height
-        self.messages: List['RenderData'] = []
+        self.messages: Deque['RenderData'] = deque(maxlen=self.MAX_MESSAGES)
+        # Подготовленные к выводу строки сообщений (отрезки (текст, атрибуты), обрезанные
+        # по ширине содержимого) в том же порядке, что и messages; None - еще не подготовлена
+        self._compiled_lines: Deque[Optional[List[Tuple[str, int]]]] = deque(maxlen=self.MAX_MESSAGES)
+        self._compiled_width = -1
         self.scroll_offset = 0  # Смещение прокрутки (0 = последние сообщения внизу)
+        # Флаг изменения содержимого и геометрия последней отрисовки
+        self._dirty = True
+        self._rendered_geometry: Optional[Tuple[int, int, int, int]] = None
+        # Изменение смещения прокрутки с последней отрисовки при неизменном содержимом
+        self._scroll_delta = 0
+        # Сообщения, добавленные в конец с последней отрисовки (при показе последних сообщений)
+        self._appended = 0
+        # Индекс первого видимого сообщения: пересчитывается при изменении
+        # сообщений, прокрутки или геометрии, а не при каждой отрисовке
+        self._visible_start = 0
+        # Строки видимого окна на момент последней полной отрисовки (None - устарели)
+        self._visible_lines: Optional[List[List[Tuple[str, int]]]] = None
+
+    @property
+    def dirty(self) -> bool:
+        """Требуется ли перерисовка лога (новые сообщения, прокрутка или смена геометрии)."""
+        return (
+            self._dirty
+            or self._scroll_delta != 0
+            or self._appended != 0
+            or self._rendered_geometry != (self.x, self.y, self.width, self.height)
+        )
+
+    @property
+    def can_render_scroll(self) -> bool:
+        """Можно ли обновить лог прокруткой вместо полной перерисовки.
+
+        Прокрутка применима либо после одного лишь изменения смещения,
+        либо после добавления сообщений в конец показанного окна.
+        """
+        if self._dirty or self._rendered_geometry != (self.x, self.y, self.width, self.height):
+            return False
+        content_height = self._get_content_height()
+        if self._appended:
+            return self._scroll_delta == 0 and self._appended < content_height
+        return 0 < abs(self._scroll_delta) < content_height
+
+    def set_geometry(self, x: int, y: int, width: int, height: int) -> bool:
+        """Устанавливает положение и размеры лога одним вызовом.
+
+        Args:
+            x: Координата X.
+            y: Координата Y.
+            width: Ширина лога.
+            height: Высота лога.
+
+        Returns:
+            True, если геометрия изменилась.
+        """
+        if (self.x, self.y, self.width, self.height) == (x, y, width, height):
+            return False
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self._recompute_window()
+        return True
+
+    def mark_dirty(self) -> None:
+        """Помечает лог как требующий перерисовки."""
+        self._dirty = True
 
     def add_message(self, message: 'RenderData') -> None:
         """Добавление сообщения в лог.
@@ -338,20 +728,38 @@ class BattleLog(Renderable):
             message: Текст сообщения.
         """
         self.messages.append(message)
-        # При добавлении нового сообщения сбрасываем прокрутку вниз
-        self.scroll_offset = 0
+        # Очереди одной длины: вытеснение старого сообщения сдвигает и его строку
+        self._compiled_lines.append(None)
+        if self.scroll_offset == 0:
+            # Окно уже показывает последние сообщения: достаточно дописать новое снизу
+            self._appended += 1
+        else:
+            # При добавлении нового сообщения сбрасываем прокрутку вниз
+            self.scroll_offset = 0
+            self._dirty = True
+        self._recompute_window()
 
     def scroll_up(self) -> None:
         """Прокрутка лога вверх."""
-        # Максимальное смещение - это количество строк, которые не помещаются
-        max_offset = max(0, len(self.messages) - self._get_content_height())
-        if self.messages:
-            self.scroll_offset = min(max_offset, self.scroll_offset + 1)
+        if not self.messages:
+            return
+        # Максимальное смещение - это количество строк, которые не помещаются.
+        # Ограничение сравнениями, без вызовов min/max на каждое нажатие
+        max_offset = len(self.messages) - self._get_content_height()
+        new_offset = self.scroll_offset + 1
+        if new_offset > max_offset:
+            new_offset = max_offset if max_offset > 0 else 0
+        if new_offset != self.scroll_offset:
+            self._scroll_delta += new_offset - self.scroll_offset
+            self.scroll_offset = new_offset
+            self._recompute_window()
 
     def scroll_down(self) -> None:
         """Прокрутка лога вниз."""
-        if self.messages:
-            self.scroll_offset = max(0, self.scroll_offset - 1)
+        if self.messages and self.scroll_offset > 0:
+            self._scroll_delta -= 1
+            self.scroll_offset -= 1
+            self._recompute_window()
 
     def _get_content_height(self) -> int:
         """Возвращает высоту области для контента (без учета рамки)."""
@@ -373,39 +781,103 @@ class BattleLog(Renderable):
         # Пока оставим пустую реализацию или базовую
         pass
 
-    def render(self, renderer: Renderer) -> None:
+    def render(self, renderer: 'Renderer') -> None:
         """Отрисовка лога боя с обрамлением."""
-        # Отрисовка рамки лога
-        try:
-            renderer.draw_borderless_log_box(self.x, self.y, self.width, self.height)
-        except curses.error:
-            # Игнорируем ошибки выхода за границы экрана
-            pass
-
-        # Определяем, какие сообщения отображать с учетом прокрутки
+        # Отрисовка рамки лога (границы экрана проверяет рендерер)
+        renderer.draw_borderless_log_box(self.x, self.y, self.width, self.height)
+
+        # Строки обрезаны по ширине лога: после ее изменения подготавливаются заново
+        content_width = self._get_content_width()
+        if content_width != self._compiled_width:
+            self._compiled_lines = deque([None] * len(self.messages), maxlen=self.MAX_MESSAGES)
+            self._compiled_width = content_width
+
+        # Размеры могли быть заданы напрямую, минуя set_geometry
+        if self._rendered_geometry != (self.x, self.y, self.width, self.height):
+            self._recompute_window()
+        # Видимые строки собираются заново, только если окно сдвинулось или изменилось
+        # содержимое; иначе (например, перерисовка после смены экрана) выводятся готовые
+        lines = self._visible_lines
+        if lines is None:
+            start_index = self._visible_start
+            message_spans = self._message_spans
+            lines = [message_spans(renderer, start_index + row)
+                     for row in range(min(self._get_content_height(), len(self.messages) - start_index))]
+            self._visible_lines = lines
+        if lines:
+            # Позиция внутри рамки: +1 для отступа от верхней и левой границы
+            renderer.draw_span_lines(lines, self.x + 1, self.y + 1)
+
+        self._dirty = False
+        self._scroll_delta = 0
+        self._appended = 0
+        self._rendered_geometry = (self.x, self.y, self.width, self.height)
+
+    def render_scroll(self, renderer: 'Renderer') -> None:
+        """Обновление лога после прокрутки или добавления сообщений.
+
+        Уже отрисованные строки сдвигаются на экране, а выводятся только
+        открывшиеся строки. Применимо, если can_render_scroll истинно.
+        """
         content_height = self._get_content_height()
-        start_index = max(0, len(self.messages) - content_height - self.scroll_offset)
-        end_index = start_index + content_height
-        visible_messages = self.messages[start_index:end_index]
-
-        # Отрисовка сообщений (с учетом рамки)
-        for i, message in enumerate(visible_messages):
-            # Позиция Y для текущего сообщения (внутри рамки)
-            msg_y = self.y + 1 + i  # +1 для отступа от верхней границы
-            # Позиция X (с небольшим отступом от левой границы)
-            msg_x = self.x + 1
-            
-            # Обрезаем сообщение, если оно слишком длинное
-            # max_length = self._get_content_width()
-            # if len(message) > max_length:
-            #     message = message[:max_length - 3] + "..."  # Добавляем многоточие
-
-            # Отрисовка текста сообщения
-            try:
-                renderer.draw_template(
-                    template=message.template,
-                    replacements=message.replacements,
-                     x=msg_x, y=msg_y)
-            except curses.error:
-                # Игнорируем ошибки выхода за границы экрана
-                pass
\ No newline at end of file
+        start_index = self._visible_start
+
+        if self._appended:
+            # Новые сообщения занимают нижние строки окна; старые уходят вверх,
+            # если окно было заполнено
+            visible = min(content_height, len(self.messages))
+            shown_before = min(content_height, len(self.messages) - self._appended)
+            overflow = shown_before + self._appended - content_height
+            if overflow > 0:
+                renderer.scroll_rows(self.y + 1, self.y + content_height, overflow)
+            exposed_rows = range(visible - self._appended, visible)
+        else:
+            # Рост смещения показывает более старые сообщения: строки уходят вниз
+            delta = self._scroll_delta
+            renderer.scroll_rows(self.y + 1, self.y + content_height, -delta)
+            exposed_rows = range(delta) if delta > 0 else range(content_height + delta, content_height)
+
+        self._draw_rows(renderer, start_index, exposed_rows)
+
+        self._scroll_delta = 0
+        self._appended = 0
+
+    def _recompute_window(self) -> None:
+        """Пересчет индекса первого видимого сообщения с учетом прокрутки."""
+        self._visible_start = max(0, len(self.messages) - self._get_content_height() - self.scroll_offset)
+        self._visible_lines = None
+
+    def _draw_rows(self, renderer: 'Renderer', start_index: int, rows: range) -> None:
+        """Отрисовка подряд идущих строк содержимого лога одним вызовом рендерера.
+
+        Args:
+            renderer: Рендерер для отрисовки.
+            start_index: Индекс сообщения в первой строке окна.
+            rows: Номера выводимых строк внутри рамки.
+        """
+        if not rows:
+            return
+        message_spans = self._message_spans
+        lines = [message_spans(renderer, start_index + row) for row in rows]
+        # Позиция внутри рамки: +1 для отступа от верхней и левой границы
+        renderer.draw_span_lines(lines, self.x + 1, self.y + 1 + rows.start)
+
+    def _message_spans(self, renderer: 'Renderer', index: int) -> List[Tuple[str, int]]:
+        """Подготовленная к выводу строка сообщения.
+
+        Args:
+            renderer: Рендерер, преобразующий шаблон в атрибуты curses.
+            index: Индекс сообщения.
+
+        Returns:
+            Отрезки (текст, атрибуты), обрезанные по ширине содержимого лога.
+        """
+        spans = self._compiled_lines[index]
+        if spans is None:
+            # Шаблон разбирается и обрезается по ширине один раз;
+            # при прокрутке и перерисовке строка выводится готовой
+            message = self.messages[index]
+            spans = clip_spans(renderer.compile_template(message.template, message.replacements),
+                               self._compiled_width)
+            self._compiled_lines[index] = spans
+        return spans
@@ -1,10 +1,38 @@
 # game/ui/components/room_sequence_components.py
 """UI компоненты для отображения прогресса последовательности комнат."""
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from game.ui.rendering.renderable import Renderable
 from game.ui.rendering.renderer import Renderer
 
+PROGRESS_BAR_WIDTH = 20
+
+
+@lru_cache(maxsize=256)
+def _progress_lines(total_rooms: int, completed_rooms: int) -> Tuple[str, Optional[str]]:
+    """
+    Строки индикатора прогресса для заданного состояния.
+
+    Состояние меняется только при прохождении комнаты, поэтому строки
+    строятся один раз на пару значений, а не при каждой отрисовке.
+
+    Args:
+        total_rooms: Общее количество комнат.
+        completed_rooms: Количество пройденных комнат.
+
+    Returns:
+        Кортеж (текст прогресса, полоса прогресса или None, если комнат нет).
+    """
+    progress_text = f"Прогресс: {completed_rooms}/{total_rooms} комнат"
+    if total_rooms <= 0:
+        return progress_text, None
+
+    filled_width = int(PROGRESS_BAR_WIDTH * completed_rooms / total_rooms)
+    filled_width = max(0, min(filled_width, PROGRESS_BAR_WIDTH))
+    bar = "[" + "=" * filled_width + " " * (PROGRESS_BAR_WIDTH - filled_width) + "]"
+    return progress_text, bar
+
 
 class RoomProgressIndicator(Renderable):
     """Индикатор прогресса по комнатам."""
@@ -26,23 +54,12 @@ class RoomProgressIndicator(Renderable):
 
     def render(self, renderer: Renderer) -> None:
         """Отрисовывает индикатор прогресса."""
-        # Создаем визуальное представление прогресса
-        progress_text = f"Прогресс: {self.completed_rooms}/{self.total_rooms} комнат"
+        progress_text, bar = _progress_lines(self.total_rooms, self.completed_rooms)
         renderer.draw_text(progress_text, self.x, self.y)
 
-        # Создаем визуальную полосу прогресса
-        if self.total_rooms > 0:
-            progress_ratio = self.completed_rooms / self.total_rooms
-            bar_width = 20
-            filled_width = int(bar_width * progress_ratio)
-            
-            # Рисуем пустую полосу
-            renderer.draw_text("[" + " " * bar_width + "]", self.x, self.y + 1)
-            
-            # Рисуем заполненную часть
-            if filled_width > 0:
-                filled_bar = "[" + "=" * filled_width
-                renderer.draw_text(filled_bar, self.x, self.y + 1)
+        # Полоса собрана целиком и выводится одним вызовом
+        if bar is not None:
+            renderer.draw_text(bar, self.x, self.y + 1)
 
 
 class SequenceStatusPanel(Renderable):
@@ -100,9 +117,29 @@ class RoomMap(Renderable):
         self.y = y
         self.total_rooms = total_rooms
         self.current_room_index = current_room_index
+        # Готовая к выводу строка карты и данные, для которых она собрана
+        self._spans_key: Optional[Tuple[int, int]] = None
+        self._spans: List[Tuple[str, int]] = []
 
     def render(self, renderer: Renderer) -> None:
-        """Отрисовывает карту комнат."""
+        """Отрисовывает карту комнат.
+
+        Шаблон карты разбирается заново только при смене числа комнат или
+        текущей комнаты; в остальных кадрах строка выводится готовыми отрезками.
+        """
+        key = (self.total_rooms, self.current_room_index)
+        if key != self._spans_key:
+            self._spans = renderer.compile_template(*self._build_template())
+            self._spans_key = key
+        renderer.draw_spans(self._spans, self.x, self.y)
+
+    def _build_template(self) -> Tuple[str, Dict[str, Tuple[str, Any, bool, bool]]]:
+        """
+        Построение шаблона карты и словаря замен.
+
+        Returns:
+            Кортеж (шаблон, словарь_замен).
+        """
         from game.ui.rendering.color_manager import Color
 
         template_parts = ["%1"]
@@ -138,6 +175,4 @@ class RoomMap(Renderable):
             if i < self.total_rooms - 1:
                 template_parts.append("-")
 
-        template = "".join(template_parts)
-        
-        renderer.draw_template(template, replacements, self.x, self.y)
\ No newline at end of file
+        return "".join(template_parts), replacements
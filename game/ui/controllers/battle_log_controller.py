@@ -5,9 +5,11 @@
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-from game.events.combat import LogUpdatedEvent
-from game.events.event import Event
+from typing import TYPE_CHECKING, Tuple, Type
+from game.events.battle_events import BattleStartedEvent, BattleEndedEvent, RoundStartedEvent
+from game.events.combat import DamageEvent, HealEvent, DeathEvent
+from game.events.event import ActionRenderEvent, Event
+from game.events.reward_events import PartyExperienceGainedEvent
 from game.systems.events.bus import NORMAL_PRIORITY
 
 if TYPE_CHECKING:
@@ -23,6 +25,15 @@ class BattleLogController:
         _is_active: Флаг активности контроллера
         _event_bus: Шина событий для подписки/отписки
     """
+
+    # Типы событий, публикуемых с данными для лога. Шина доставляет события
+    # только подписчикам их точного типа (и базового Event), поэтому контроллер
+    # подписывается на каждый тип, а не на все события шины
+    _EVENT_TYPES: Tuple[Type[Event], ...] = (
+        BattleStartedEvent, BattleEndedEvent, RoundStartedEvent,
+        DamageEvent, HealEvent, DeathEvent,
+        ActionRenderEvent, PartyExperienceGainedEvent,
+    )
     
     def __init__(self, event_bus: 'EventBus', battle_log: 'BattleLog') -> None:
         """Инициализирует контроллер лога боя.
@@ -36,35 +47,31 @@ class BattleLogController:
         self._event_bus = event_bus
     
     def activate(self) -> None:
-        """Активирует контроллер - подписывается на события напрямую."""
+        """Активирует контроллер - подписывается на события с данными для лога."""
         if not self._is_active:
-            self._event_bus.subscribe(None, Event, self._handle_event, NORMAL_PRIORITY)
+            for event_type in self._EVENT_TYPES:
+                self._event_bus.subscribe(None, event_type, self._handle_event, NORMAL_PRIORITY)
             self._is_active = True
     
     def deactivate(self) -> None:
         """Деактивирует контроллер - отписывается от событий."""
+        # Отписка от отсутствующей подписки шиной не считается ошибкой
         if self._is_active:
-            try:
-                self._event_bus.unsubscribe(None, Event, self._handle_event)
-                self._is_active = False
-            except Exception as e:
-                # Логирование ошибки отписки можно добавить при необходимости
-                pass
+            for event_type in self._EVENT_TYPES:
+                self._event_bus.unsubscribe(None, event_type, self._handle_event)
+            self._is_active = False
     
     def _handle_event(self, event: Event) -> None:
         """Обрабатывает событие и добавляет в лог.
+
+        Экран здесь не перерисовывается: сообщения одного хода накапливаются
+        в логе, а перерисовку один раз за ход запрашивает BattleRound через
+        LogUpdatedEvent. Так серия событий одного хода дает один кадр.
+        Ошибки не подавляются: о них сообщает шина событий.
         
         Args:
             event: Событие для обработки
         """
-        try:
-            if hasattr(event, 'render_data') and event.render_data:
-                self.battle_log.add_message(event.render_data)
-                self._render_battle_screen()
-        except Exception as e:
-            # Обработка ошибок добавления сообщения в лог
-            pass
-
-    def _render_battle_screen(self) -> None:
-        pass
-        #self._event_bus.publish(LogUpdatedEvent(source=None, need_render=True))
\ No newline at end of file
+        render_data = event.render_data
+        if render_data:
+            self.battle_log.add_message(render_data)
@@ -1,15 +1,18 @@
 # game/ui/encounter_screen.py
 """Универсальный экран для отображения событий похода (Encounter)."""
 import curses
-from typing import TYPE_CHECKING, Dict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Tuple, Union
 
-from game.events.battle_events import BattleEndedEvent
+from game.config import get_config
+from game.events.battle_events import BattleStartedEvent, BattleEndedEvent
 from game.events.combat import LogUpdatedEvent
 from game.events.encounter_events import RoomSequenceCompletedEvent
-from game.events.event import Event
 from game.mixins.ui_mixin import StandardLayoutMixin
 from game.ui.base_screen import BaseScreen
 from game.ui.command_system.command import LambdaCommand
+from game.ui.command_system.screen_command_registry import get_screen_commands
 from game.ui.components.battle_components import PlayerGroupPanel, EnemyGroupPanel, BattleLog
 from game.ui.components.room_sequence_components import RoomMap
 from game.events.render_data import RenderData
@@ -17,12 +20,88 @@ from game.ui.rendering.color_manager import Color
 from game.ui.rendering.render_data_builder import RenderDataBuilder
 
 if TYPE_CHECKING:
+    from game.events.event import Event
+    from game.ui.rendering.renderer import Renderer
     from game.ui.screen_manager import ScreenManager
 
 
+class Rect(NamedTuple):
+    """Прямоугольная область экрана."""
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass(frozen=True, slots=True)
+class EncounterLayout:
+    """Неизменяемый макет компонентов экрана похода."""
+    room_map: Rect
+    left_panel: Rect
+    right_panel: Rect
+    event_log: Rect
+
+    @property
+    def panel_rects(self) -> Tuple[Rect, Rect, Rect]:
+        """Области панелей в порядке EncounterScreen._panels."""
+        return self.left_panel, self.right_panel, self.event_log
+
+
+@lru_cache(maxsize=16)
+def _compute_layout(screen_width: int, screen_height: int,
+                    header_height: int, units_height: int, footer_y_offset: int,
+                    horizontal_margin: int, groups_gap: int,
+                    min_log_height: int, min_log_width: int) -> EncounterLayout:
+    """
+    Рассчитывает макет экрана похода.
+
+    Чистая целочисленная функция: результат зависит только от аргументов,
+    поэтому макеты кэшируются и разделяются между экземплярами экрана.
+
+    Args:
+        screen_width: Ширина экрана.
+        screen_height: Высота экрана.
+        header_height: Высота шапки.
+        units_height: Высота панелей групп.
+        footer_y_offset: Отступ подвала от нижнего края.
+        horizontal_margin: Горизонтальный отступ панелей групп.
+        groups_gap: Промежуток между панелями групп.
+        min_log_height: Минимальная высота лога.
+        min_log_width: Минимальная ширина лога.
+
+    Returns:
+        EncounterLayout: Неизменяемый макет компонентов.
+    """
+    total_units_width = max(0, screen_width - 2 * horizontal_margin - groups_gap)
+    left_panel_width = total_units_width // 2
+    right_panel_width = total_units_width - left_panel_width
+    left_panel_x = horizontal_margin
+    right_panel_x = left_panel_x + left_panel_width + groups_gap
+
+    log_y = header_height + units_height
+    log_width = max(min_log_width, screen_width)  # Лог занимает всю ширину экрана
+    log_height = max(min_log_height, screen_height - log_y - footer_y_offset)
+
+    return EncounterLayout(
+        room_map=Rect(0, 0, screen_width, 1),
+        left_panel=Rect(left_panel_x, header_height, left_panel_width, units_height),
+        right_panel=Rect(right_panel_x, header_height, right_panel_width, units_height),
+        event_log=Rect(0, log_y, log_width, log_height)
+    )
+
+
+@lru_cache(maxsize=1)
+def _fallback_screen_size() -> Tuple[int, int]:
+    """Размеры экрана из настроек UI, используемые при отсутствии рендерера."""
+    ui_settings = get_config().ui
+    return ui_settings.screen_width, ui_settings.screen_height
+
+
 class EncounterScreen(BaseScreen, StandardLayoutMixin):
     """Экран для отображения и взаимодействия с событиями похода."""
 
+    TITLE = "=== ПОХОД ==="
+
     # --- Константы для макета ---
     HEADER_HEIGHT = 2  # Увеличиваем высоту для карты комнат
     UNITS_HEIGHT = 5
@@ -48,6 +127,22 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         self.right_panel: EnemyGroupPanel | None = None
         self.event_log: BattleLog | None = None
         self.room_map: RoomMap | None = None
+        # Панели с set_geometry в порядке EncounterLayout.panel_rects
+        self._panels: Tuple[Union[PlayerGroupPanel, EnemyGroupPanel, BattleLog], ...] = ()
+        # Элементы над логом, отрисовываемые каждый кадр
+        self._frame_elements: Tuple[Union[RoomMap, PlayerGroupPanel, EnemyGroupPanel], ...] = ()
+
+        # Макет, по которому расположены компоненты. _compute_layout кэширует
+        # макеты, поэтому неизменность макета проверяется сравнением ссылок
+        self._layout_cache: Optional[EncounterLayout] = None
+        # Рендерер, под размеры которого расположены компоненты.
+        # Размеры рендерера неизменны: при изменении окна ScreenManager создает новый
+        self._sized_renderer: Optional['Renderer'] = None
+        # Флаг необходимости перерисовки экрана
+        self._dirty = True
+        # Мог ли измениться состав групп или карта комнат: данные панелей
+        # обновляются из game_manager по событиям, а не в каждом кадре
+        self._panel_data_stale = True
 
         super().__init__(manager)
         self._setup_event_listeners()
@@ -56,16 +151,19 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         """Обновляет данные в панелях из game_manager."""
         if not self.manager or not self.manager.game_manager:
             return
+        self._panel_data_stale = False
 
         game_manager = self.manager.game_manager
 
         if self.left_panel:
             player_data = game_manager.get_player_group()
-            self.left_panel.update_players(player_data)
+            if self.left_panel.update_players(player_data):
+                self._dirty = True
 
         if self.right_panel:
             enemy_data = game_manager.get_current_enemies()
-            self.right_panel.update_enemies(enemy_data)
+            if self.right_panel.update_enemies(enemy_data):
+                self._dirty = True
         
         self._update_room_map()
 
@@ -73,8 +171,12 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         """Обновляет данные в карте комнат."""
         if self.room_map and self.encounter_manager.current_room_sequence:
             sequence = self.encounter_manager.current_room_sequence
-            self.room_map.total_rooms = sequence.get_total_rooms()
-            self.room_map.current_room_index = sequence.progress.current_room_index
+            total_rooms = sequence.get_total_rooms()
+            current_room_index = sequence.progress.current_room_index
+            if (total_rooms, current_room_index) != (self.room_map.total_rooms, self.room_map.current_room_index):
+                self.room_map.total_rooms = total_rooms
+                self.room_map.current_room_index = current_room_index
+                self._dirty = True
 
     def on_enter(self) -> None:
         """Вызывается при переключении на этот экран."""
@@ -84,7 +186,7 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
                 self.event_log.add_message(RenderData(template=encounter_description, replacements={}))
         
         self.state = "BATTLE"
-        self._setup_commands()
+        self._reset_commands()
         
         if self.encounter_manager.current_encounter:
             self.encounter_manager.start_encounter(self.encounter_manager.current_encounter)
@@ -93,12 +195,28 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         """Настраивает обработчики событий."""
         event_bus = self.manager.game_manager.event_bus
         event_bus.subscribe(None, LogUpdatedEvent, self._on_log_update_event)
+        event_bus.subscribe(None, BattleStartedEvent, self._on_battle_started)
         event_bus.subscribe(None, BattleEndedEvent, self._on_battle_ended)
         event_bus.subscribe(None, RoomSequenceCompletedEvent, self._on_sequence_completed)
 
-    def _on_log_update_event(self, event: Event) -> None:
-        """Обработчик событий обновления лога."""
+    def _render_now(self) -> None:
+        """
+        Отрисовка экрана с немедленным выводом на терминал.
+
+        Используется вне основного цикла (обработчики событий боя), где
+        кадр должен появиться сразу, не дожидаясь ScreenManager.run.
+        """
         self.render(self.renderer.stdscr)
+        self.renderer.commit()
+
+    def _on_log_update_event(self, event: 'Event') -> None:
+        """Обработчик событий обновления лога."""
+        # Лог и панели групп сами определяют, изменилось ли их содержимое
+        self._render_now()
+
+    def _on_battle_started(self, event: BattleStartedEvent) -> None:
+        """Обработчик начала боя: состав групп мог измениться."""
+        self._panel_data_stale = True
 
     def _on_battle_ended(self, event: BattleEndedEvent) -> None:
         """Обработчик события завершения боя."""
@@ -107,17 +225,18 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
                 return
 
             self.state = "VICTORY"
-            self._setup_commands()
+            self._reset_commands()
 
         else:
             self.state = "BATTLE_LOST"
-            self._setup_commands()
+            self._reset_commands()
         
-        self.render(self.renderer.stdscr)
+        self._render_now()
 
     def _on_sequence_completed(self, event: RoomSequenceCompletedEvent) -> None:
         """Обработчик завершения всей последовательности комнат."""
         self.state = "SEQUENCE_COMPLETE"
+        self._panel_data_stale = True
         if self.event_log:
             if event.success:
                 result_text = "Победа"
@@ -132,32 +251,17 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
                 .add_text(". Нажмите Enter, чтобы выйти.")
                 .build())
             self.event_log.add_message(message_data)
-        self._setup_commands()
-        self.render(self.renderer.stdscr)
+        self._reset_commands()
+        self._render_now()
 
-    def _recalculate_layout(self, screen_width: int, screen_height: int) -> Dict[str, Dict[str, int]]:
+    def _recalculate_layout(self, screen_width: int, screen_height: int) -> EncounterLayout:
         """Пересчитывает размеры и позиции компонентов."""
-        room_map_y = 0
-        units_y = self.HEADER_HEIGHT
-        total_units_width = max(0, screen_width - 2 * self.HORIZONTAL_MARGIN - self.GROUPS_GAP)
-        half_width = total_units_width // 2
-        left_panel_width = half_width
-        right_panel_width = total_units_width - left_panel_width
-        left_panel_x = self.HORIZONTAL_MARGIN
-        right_panel_x = left_panel_x + left_panel_width + self.GROUPS_GAP
-
-        log_x = 0
-        log_y = units_y + self.UNITS_HEIGHT
-        log_width = max(self.MIN_LOG_WIDTH, screen_width)
-        available_height = screen_height - log_y - self.FOOTER_Y_OFFSET
-        log_height = max(self.MIN_LOG_HEIGHT, available_height)
-
-        return {
-            'room_map': {'x': 0, 'y': room_map_y, 'width': screen_width, 'height': 1},
-            'left_panel': {'x': left_panel_x, 'y': units_y, 'width': left_panel_width, 'height': self.UNITS_HEIGHT},
-            'right_panel': {'x': right_panel_x, 'y': units_y, 'width': right_panel_width, 'height': self.UNITS_HEIGHT},
-            'event_log': {'x': log_x, 'y': log_y, 'width': log_width, 'height': log_height}
-        }
+        return _compute_layout(
+            screen_width, screen_height,
+            self.HEADER_HEIGHT, self.UNITS_HEIGHT, self.FOOTER_Y_OFFSET,
+            self.HORIZONTAL_MARGIN, self.GROUPS_GAP,
+            self.MIN_LOG_HEIGHT, self.MIN_LOG_WIDTH
+        )
 
     def _setup_elements(self) -> None:
         """Настройка элементов экрана."""
@@ -170,10 +274,16 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         player_data = game_manager.get_player_group()
         enemy_data = game_manager.get_current_enemies()
 
-        screen_width = self.renderer.width if self.renderer else 80
-        screen_height = self.renderer.height if self.renderer else 24
+        if self.renderer:
+            screen_width, screen_height = self.renderer.width, self.renderer.height
+            # Компоненты сразу создаются под размеры рендерера, поэтому первый
+            # кадр не повторяет расчет макета в _update_component_sizes
+            self._sized_renderer = self.renderer
+        else:
+            screen_width, screen_height = _fallback_screen_size()
 
         layout = self._recalculate_layout(screen_width, screen_height)
+        self._layout_cache = layout
 
         if self.encounter_manager.current_room_sequence:
             sequence = self.encounter_manager.current_room_sequence
@@ -181,28 +291,33 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
             current_room_index = sequence.progress.current_room_index
             
             self.room_map = RoomMap(
-                x=layout['room_map']['x'], y=layout['room_map']['y'],
+                x=layout.room_map.x, y=layout.room_map.y,
                 total_rooms=total_rooms,
                 current_room_index=current_room_index
             )
 
         self.left_panel = PlayerGroupPanel(
-            x=layout['left_panel']['x'], y=layout['left_panel']['y'],
-            width=layout['left_panel']['width'], height=layout['left_panel']['height'],
+            x=layout.left_panel.x, y=layout.left_panel.y,
+            width=layout.left_panel.width, height=layout.left_panel.height,
             players=player_data
         )
 
         self.right_panel = EnemyGroupPanel(
-            x=layout['right_panel']['x'], y=layout['right_panel']['y'],
-            width=layout['right_panel']['width'], height=layout['right_panel']['height'],
+            x=layout.right_panel.x, y=layout.right_panel.y,
+            width=layout.right_panel.width, height=layout.right_panel.height,
             enemies=enemy_data
         )
 
         self.event_log = BattleLog(
-            x=layout['event_log']['x'], y=layout['event_log']['y'],
-            width=layout['event_log']['width'], height=layout['event_log']['height']
+            x=layout.event_log.x, y=layout.event_log.y,
+            width=layout.event_log.width, height=layout.event_log.height
         )
-        
+        self._panels = (self.left_panel, self.right_panel, self.event_log)
+        self._frame_elements = tuple(
+            element for element in (self.room_map, self.left_panel, self.right_panel)
+            if element is not None
+        )
+
         self.manager.game_manager.battle_manager.setup_battle_log_controller(
             event_bus=self.manager.game_manager.event_bus, 
             battle_log=self.event_log
@@ -212,29 +327,45 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
         """Обновление размеров компонентов."""
         if not self.renderer: return
 
-        screen_width, screen_height = self.renderer.width, self.renderer.height
-        layout = self._recalculate_layout(screen_width, screen_height)
+        self._sized_renderer = self.renderer
+        layout = self._recalculate_layout(self.renderer.width, self.renderer.height)
+        # Тот же макет из кэша - компоненты уже расположены по нему
+        if layout is self._layout_cache:
+            return
+        self._layout_cache = layout
 
-        if self.room_map:
-            self.room_map.x, self.room_map.y = layout['room_map']['x'], layout['room_map']['y']
+        if self.room_map and (self.room_map.x, self.room_map.y) != layout.room_map[:2]:
+            self.room_map.x, self.room_map.y = layout.room_map.x, layout.room_map.y
+            self._dirty = True
 
-        if self.left_panel:
-            self.left_panel.x, self.left_panel.y = layout['left_panel']['x'], layout['left_panel']['y']
-            self.left_panel.width, self.left_panel.height = layout['left_panel']['width'], layout['left_panel']['height']
-            self.left_panel._update_panels()
+        if self._apply_geometry(self._panels, layout.panel_rects):
+            self._dirty = True
 
-        if self.right_panel:
-            self.right_panel.x, self.right_panel.y = layout['right_panel']['x'], layout['right_panel']['y']
-            self.right_panel.width, self.right_panel.height = layout['right_panel']['width'], layout['right_panel']['height']
-            self.right_panel._update_panels()
+    @staticmethod
+    def _apply_geometry(panels: Iterable[Union[PlayerGroupPanel, EnemyGroupPanel, BattleLog]],
+                        rects: Iterable[Rect]) -> bool:
+        """Применяет области макета к панелям.
 
-        if self.event_log:
-            self.event_log.x, self.event_log.y = layout['event_log']['x'], layout['event_log']['y']
-            self.event_log.width, self.event_log.height = layout['event_log']['width'], layout['event_log']['height']
+        Панели перестраиваются только если их геометрия действительно изменилась.
+
+        Args:
+            panels: Панели экрана.
+            rects: Области макета в том же порядке.
+
+        Returns:
+            True, если изменилась геометрия хотя бы одной панели.
+        """
+        changed = False
+        for panel, rect in zip(panels, rects):
+            if panel.set_geometry(*rect):
+                changed = True
+        return changed
 
     def _setup_commands(self) -> None:
         """Настройка команд в зависимости от состояния экрана."""
         self.command_registry.clear()
+        # Набор команд в подвале меняется вместе с состоянием экрана
+        self._dirty = True
 
         if self.state == "VICTORY":
             self.add_command(LambdaCommand(
@@ -253,15 +384,33 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
                 action=lambda context: self.manager.change_screen("main")
             ))
 
+    def _reset_commands(self) -> None:
+        """Перестройка команд при смене состояния экрана.
+
+        _setup_commands очищает реестр вместе с автоматически зарегистрированными
+        командами экрана. Во время боя они регистрируются заново целиком, в
+        остальных состояниях - только команды, доступные всегда (прокрутка лога):
+        боевые команды заняли бы клавиши команд состояния (Enter).
+        """
+        self._setup_commands()
+        if self.state == "BATTLE":
+            self._setup_auto_commands()
+            return
+        for command in get_screen_commands(self.__class__):
+            if command.always_available:
+                self.add_command(command)
+
     def _prepare_next_room(self) -> None:
         """Готовит переход в следующую комнату."""
         if self.encounter_manager.advance_to_next_room():
+            # Сменилась текущая комната: карта и состав врагов перечитываются
+            self._panel_data_stale = True
             self._setup_new_room()
             self.state = "BATTLE"
-            self._setup_commands()
+            self._reset_commands()
             
             self.encounter_manager._execute_current_event()
-            self.render(self.renderer.stdscr)
+            self._render_now()
 
     def _setup_new_room(self) -> None:
         """Настраивает новую комнату, создавая врагов."""
@@ -273,23 +422,77 @@ class EncounterScreen(BaseScreen, StandardLayoutMixin):
             )
             self._refresh_panel_data()
 
+    def _needs_render(self) -> bool:
+        """Проверяет, изменилось ли что-либо на экране с последней отрисовки."""
+        return (
+            self._dirty
+            or self.renderer.needs_full_clear
+            or any(panel.dirty for panel in self._panels)
+        )
+
     def render(self, stdscr: curses.window) -> None:
-        """Отрисовка экрана."""
-        self._refresh_panel_data()
-        self._update_component_sizes()
-        self.renderer.clear()
-        self.render_standard_layout("=== ПОХОД ===")
-
-        if self.room_map: self.room_map.render(self.renderer)
-        if self.left_panel: self.left_panel.render(self.renderer)
-        if self.right_panel: self.right_panel.render(self.renderer)
-        if self.event_log: self.event_log.render(self.renderer)
-        
-        self.renderer.refresh()
-
-    def _handle_unregistered_key(self, key: int) -> None:
-        """Обработка незарегистрированных клавиш."""
-        if key == curses.KEY_UP:
-            if self.event_log: self.event_log.scroll_up()
-        elif key == curses.KEY_DOWN:
-            if self.event_log: self.event_log.scroll_down()
\ No newline at end of file
+        """Отрисовка экрана.
+
+        Если с последней отрисовки ничего не изменилось, экран не перерисовывается.
+        Состав групп перечитывается только после событий, которые могли его
+        изменить; HP и прочие данные юнитов панели читают сами.
+        """
+        if self._panel_data_stale:
+            self._refresh_panel_data()
+        # Размеры пересчитываются только после замены рендерера (изменения окна)
+        if self.renderer is not self._sized_renderer:
+            self._update_component_sizes()
+        if not self._needs_render():
+            return
+
+        # Локальные ссылки: рендерер используется на всем пути отрисовки кадра
+        renderer = self.renderer
+        full_clear = renderer.needs_full_clear
+        log = self.event_log
+        # Лог перерисовывается только при изменениях или полной очистке экрана
+        render_log = log is not None and (full_clear or log.dirty)
+        # После одной лишь прокрутки достаточно сдвинуть уже выведенные строки лога
+        scroll_log = render_log and not full_clear and log.can_render_scroll
+
+        if self._dirty or full_clear:
+            if log and (not render_log or scroll_log):
+                # Строки лога остаются на экране: очищаем только область панелей и подвал
+                renderer.clear_rows(self.HEADER_HEIGHT, log.y)
+                renderer.clear_rows(log.y + log.height, renderer.height)
+            else:
+                # Шапка перерисовывается поверх, поэтому очищаем только область под ней
+                renderer.clear_below(self.HEADER_HEIGHT)
+            self.render_standard_layout(self.TITLE)
+
+            for element in self._frame_elements:
+                element.render(renderer)
+        else:
+            # Макет не изменился: перерисовываются только строки юнитов с новыми данными
+            for panel in (self.left_panel, self.right_panel):
+                if panel is not None:
+                    panel.render_changed(renderer)
+            if render_log and not scroll_log:
+                renderer.clear_region(log.x, log.y, log.width, log.height)
+
+        if scroll_log:
+            log.render_scroll(renderer)
+        elif render_log:
+            log.render(renderer)
+
+        renderer.refresh()
+        self._dirty = False
+
+    def handle_input(self, key: int) -> None:
+        """
+        Обработка ввода пользователя.
+
+        Выполненная команда может изменить состояние боя, поэтому экран помечается
+        для перерисовки. Прокрутка лога отслеживается самим логом.
+
+        Args:
+            key: Нажатая клавиша
+        """
+        command = self.command_registry.get_command_by_key(key)
+        if command is not None and command.redraws_screen:
+            self._dirty = True
+        super().handle_input(key)
\ No newline at end of file
@@ -62,7 +62,7 @@ class EncounterSelectionScreen(BaseScreen):
 
     def render(self, stdscr: curses.window) -> None:
         """Отрисовка экрана."""
-        self.renderer.clear()
+        self.renderer.erase()
         
         # Ручная отрисовка заголовка
         title = "=== ВЫБОР ПОХОДА ==="
@@ -73,10 +73,9 @@ class EncounterSelectionScreen(BaseScreen):
             element.render(self.renderer)
             
         # Ручная отрисовка подвала с командами
-        commands = self.command_registry.get_all_commands()
         footer_y = self.renderer.height - 1
         command_renderer = CommandRenderer(y=footer_y)
-        command_elements = command_renderer.render_commands(commands)
+        command_elements = command_renderer.render_commands(self.command_registry)
         for element in command_elements:
             element.render(self.renderer)
 
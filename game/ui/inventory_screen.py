@@ -40,7 +40,7 @@ class InventoryScreen(BaseScreen, StandardLayoutMixin):
     # --- ОБНОВЛЯЕМ МЕТОД render ---
     def render(self, stdscr: curses.window) -> None:
         """Отрисовка экрана."""
-        self.renderer.clear()
+        self.renderer.erase()
         
         # Отрисовка стандартного макета
         self.render_standard_layout("=== ИНВЕНТАРЬ ===")
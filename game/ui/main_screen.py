@@ -42,7 +42,7 @@ class MainScreen(BaseScreen, StandardLayoutMixin):
     # --- ОБНОВЛЯЕМ МЕТОД render ---
     def render(self, stdscr: curses.window) -> None:
         """Отрисовка экрана."""
-        self.renderer.clear()
+        self.renderer.erase()
         
         # Отрисовка стандартного макета (шапка + подвал)
         self.render_standard_layout("=== ГЛАВНОЕ МЕНЮ ===")
@@ -6,7 +6,7 @@
 
 import curses
 from enum import Enum
-from typing import Any  # Для аннотации stdscr
+from typing import Any, Dict  # Any - для аннотации stdscr
 
 
 class Color(Enum):
@@ -28,7 +28,9 @@ class ColorManager:
 
     def __init__(self) -> None:
         """Инициализация менеджера цветов."""
-        self.color_pairs: dict = {}
+        # Атрибуты curses для каждого цвета: заполняются при инициализации,
+        # чтобы отрисовка не вызывала curses.color_pair на каждый отрезок текста
+        self.color_pairs: Dict[Color, int] = {}
         self._initialized = False
 
     def initialize(self, stdscr: Any) -> None:
@@ -53,6 +55,7 @@ class ColorManager:
             # TODO: Проверить поддержку цвета 8 (GRAY) в различных терминалах
             curses.init_pair(Color.GRAY.value, 8, -1)
 
+            self.color_pairs = {color: curses.color_pair(color.value) for color in Color}
             self._initialized = True
 
     def get_color_pair(self, color: Color) -> int:
@@ -65,6 +68,5 @@ class ColorManager:
         Returns:
             Цветовая пара для curses.
         """
-        if not self._initialized:
-            return curses.A_NORMAL
-        return curses.color_pair(color.value)
+        # До инициализации словарь пуст: цвета не используются
+        return self.color_pairs.get(color, curses.A_NORMAL)
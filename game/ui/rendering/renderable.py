@@ -15,7 +15,14 @@ if TYPE_CHECKING:
 
 
 class Renderable(ABC):
-    """Абстрактный базовый класс для всех отображаемых элементов."""
+    """Абстрактный базовый класс для всех отображаемых элементов.
+
+    Базовые элементы этого модуля объявляют __slots__: они создаются в большом
+    количестве и живут между кадрами, поэтому обходятся без __dict__.
+    Подклассы без собственных __slots__ по-прежнему получают __dict__.
+    """
+
+    __slots__ = ('x', 'y')
 
     def __init__(self, x: int = 0, y: int = 0):
         """
@@ -42,6 +49,8 @@ class Renderable(ABC):
 class Text(Renderable):
     """Текстовый элемент."""
 
+    __slots__ = ('text', 'bold', 'dim', 'color')
+
     def __init__(self, text: str, x: int = 0, y: int = 0,
                  bold: bool = False, dim: bool = False, color: Color = Color.DEFAULT):
         """
@@ -69,6 +78,8 @@ class Text(Renderable):
 class TemplateText(Renderable):
     """Текст с шаблонами и цветами."""
 
+    __slots__ = ('template', 'replacements')
+
     def __init__(self, template: str, replacements: Dict[str, Tuple[str, Color, bool, bool]],
                  x: int = 0, y: int = 0):
         """
@@ -92,6 +103,8 @@ class TemplateText(Renderable):
 class Button(Renderable):
     """Кнопка."""
 
+    __slots__ = ('text', 'key', 'color', 'bold', 'dim')
+
     def __init__(self, text: str, x: int = 0, y: int = 0,
                  key: str = "", color: Color = Color.DEFAULT, bold: bool = False, dim: bool = False):
         """
@@ -122,6 +135,8 @@ class Button(Renderable):
 class Separator(Renderable):
     """Разделительная линия."""
 
+    __slots__ = ('char', 'length', 'color', 'bold', 'dim', '_line', '_line_length')
+
     def __init__(self, y: int, char: str = "─", length: Optional[int] = None,
                  color: Color = Color.RED, bold: bool = False, dim: bool = True):
         """
@@ -141,9 +156,14 @@ class Separator(Renderable):
         self.color = color
         self.bold = bold
         self.dim = dim
+        # Строка линии и длина, для которой она построена: пересобирается только при смене ширины
+        self._line = ""
+        self._line_length: Optional[int] = None
 
     def render(self, renderer: 'Renderer') -> None:
         """Отрисовка разделителя."""
         line_length = self.length or renderer.width
-        line = self.char * (line_length - 1)
-        renderer.draw_text(line, self.x, self.y, self.bold, self.dim, self.color)
+        if line_length != self._line_length:
+            self._line = self.char * (line_length - 1)
+            self._line_length = line_length
+        renderer.draw_text(self._line, self.x, self.y, self.bold, self.dim, self.color)
@@ -6,13 +6,30 @@
 """
 
 import curses
-from turtle import color
-from typing import Dict, Tuple, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 
 from game.ui.rendering.color_manager import Color, ColorManager
 from game.ui.rendering.template_renderer import TemplateRenderer
 
 
+@lru_cache(maxsize=8)
+def _log_box_edges(width: int) -> Tuple[str, str]:
+    """
+    Верхняя и нижняя границы рамки лога заданной ширины.
+
+    Строки зависят только от ширины, поэтому строятся один раз на размер окна.
+
+    Args:
+        width: Ширина рамки.
+
+    Returns:
+        Пара строк (верхняя граница, нижняя граница).
+    """
+    half = "─" * ((width - 3) // 2)
+    return "├" + half + "┴" + half + "┤", "└" + "─" * (width - 2) + "┘"
+
+
 class Renderer:
     """Рендерер для отрисовки элементов на экране."""
 
@@ -28,10 +45,153 @@ class Renderer:
         self.color_manager = color_manager
         self.template_renderer = TemplateRenderer(color_manager)
         self.height, self.width = stdscr.getmaxyx()
+        # Новый рендерер (старт или изменение размера) требует полной очистки экрана
+        self._full_clear_pending = True
+        # Содержимое терминала неизвестно (старт или изменение размера):
+        # его нужно стереть и вывести заново, а не сравнивать с буфером curses
+        self._terminal_stale = True
+        # Атрибуты, установленные окну через attrset (None - неизвестны)
+        self._current_attr: Optional[int] = None
+        # Есть ли перенесенные в виртуальный экран, но еще не выведенные изменения
+        self._update_pending = False
+
+    def _set_attr(self, attr: int) -> None:
+        """
+        Установка текущих атрибутов окна, только если они отличаются от уже установленных.
+
+        Текст выводится addstr без аргумента атрибутов: иначе curses на каждый
+        вызов сохраняет, подменяет и восстанавливает атрибуты окна.
+
+        Args:
+            attr: Атрибуты curses (цветовая пара, жирный, тусклый).
+        """
+        if attr != self._current_attr:
+            self.stdscr.attrset(attr)
+            self._current_attr = attr
 
     def clear(self) -> None:
-        """Очистка экрана."""
+        """Очистка экрана с полной перерисовкой терминала при следующем refresh."""
         self.stdscr.clear()
+        self._full_clear_pending = False
+        self._terminal_stale = False
+        self._current_attr = None
+
+    def erase(self) -> None:
+        """
+        Очистка экрана без принудительной перерисовки терминала.
+
+        Очищается только виртуальный буфер curses: при refresh в терминал
+        выводятся лишь ячейки, отличающиеся от уже показанных. Терминал
+        стирается полностью только у нового рендерера (старт, изменение размера).
+        """
+        if self._terminal_stale:
+            self.clear()
+            return
+        self.stdscr.erase()
+        self._full_clear_pending = False
+
+    @property
+    def needs_full_clear(self) -> bool:
+        """Требуется ли полная очистка экрана при следующей отрисовке."""
+        return self._full_clear_pending
+
+    def invalidate(self) -> None:
+        """
+        Помечает экран как требующий полной очистки при следующей отрисовке.
+
+        Терминал при этом не стирается: новое содержимое сравнивается
+        с уже показанным, и выводятся только отличающиеся ячейки.
+        """
+        self._full_clear_pending = True
+
+    def clear_below(self, from_y: int) -> None:
+        """
+        Очистка экрана начиная со строки from_y и до конца.
+
+        Строки выше from_y сохраняются. Если экран помечен для полной
+        очистки (смена экрана, изменение размера), очищается весь экран.
+
+        Args:
+            from_y: Первая очищаемая строка.
+        """
+        if self._full_clear_pending or from_y <= 0:
+            self.erase()
+            return
+
+        try:
+            self.stdscr.move(from_y, 0)
+            self.stdscr.clrtobot()
+        except curses.error:
+            # Игнорируем ошибки выхода за границы экрана
+            pass
+
+    def clear_rows(self, from_y: int, to_y: int) -> None:
+        """
+        Очистка строк экрана в диапазоне [from_y, to_y).
+
+        Args:
+            from_y: Первая очищаемая строка.
+            to_y: Строка, на которой очистка останавливается (не включается).
+        """
+        move, clrtoeol = self.stdscr.move, self.stdscr.clrtoeol
+        for row in range(max(0, from_y), min(to_y, self.height)):
+            try:
+                move(row, 0)
+                clrtoeol()
+            except curses.error:
+                pass
+
+    def clear_region(self, x: int, y: int, width: int, height: int) -> None:
+        """
+        Очистка прямоугольной области экрана.
+
+        Args:
+            x: Координата X левого верхнего угла.
+            y: Координата Y левого верхнего угла.
+            width: Ширина области.
+            height: Высота области.
+        """
+        if x < 0 or x >= self.width:
+            return
+        blank = " " * min(width, self.width - x)
+        if not blank:
+            return
+        self._set_attr(curses.A_NORMAL)
+        addstr = self.stdscr.addstr
+        for row in range(max(0, y), min(y + height, self.height)):
+            try:
+                addstr(row, x, blank)
+            except curses.error:
+                # Запись в правый нижний угол экрана вызывает ошибку после вывода
+                pass
+
+    def scroll_rows(self, top: int, bottom: int, lines: int) -> None:
+        """
+        Сдвиг строк экрана в диапазоне [top, bottom] на lines строк.
+
+        Положительное lines сдвигает строки вверх, отрицательное - вниз.
+        Освободившиеся строки остаются пустыми. При idlok curses может
+        передать сдвиг терминалу одной командой вместо перерисовки строк.
+
+        Args:
+            top: Первая строка области прокрутки.
+            bottom: Последняя строка области прокрутки (включительно).
+            lines: Количество строк для сдвига.
+        """
+        bottom = min(bottom, self.height - 1)
+        if lines == 0 or top < 0 or top > bottom:
+            return
+
+        try:
+            self.stdscr.idlok(True)
+            self.stdscr.scrollok(True)
+            self.stdscr.setscrreg(top, bottom)
+            self.stdscr.scroll(lines)
+        except curses.error:
+            pass
+        finally:
+            self.stdscr.scrollok(False)
+            self.stdscr.setscrreg(0, self.height - 1)
 
     def draw_text(self, text: str, x: int, y: int,
                   bold: bool = False, dim: bool = False, color: Color = Color.DEFAULT) -> None:
@@ -46,21 +206,24 @@ class Renderer:
             dim: Тусклый шрифт.
             color: Цвет текста.
         """
+        # Проверяем границы экрана: текст за правым краем не выводится
+        if y >= self.height or x >= self.width or y < 0 or x < 0:
+            return
+        if len(text) > self.width - x:
+            text = text[:self.width - x]
+
+        # Получаем атрибуты
+        attr = self.color_manager.get_color_pair(color)
+        if bold:
+            attr |= curses.A_BOLD
+        if dim:
+            attr |= curses.A_DIM
+
+        self._set_attr(attr)
         try:
-            # Проверяем границы экрана
-            if y >= self.height or x >= self.width or y < 0 or x < 0:
-                return
-
-            # Получаем атрибуты
-            attr = self.color_manager.get_color_pair(color)
-            if bold:
-                attr |= curses.A_BOLD
-            if dim:
-                attr |= curses.A_DIM
-
-            self.stdscr.addstr(y, x, text, attr)
+            self.stdscr.addstr(y, x, text)
         except curses.error:
-            # Игнорируем ошибки выхода за границы экрана
+            # Запись в правый нижний угол экрана вызывает ошибку после вывода
             pass
 
     def draw_template(self, template: str, replacements: Dict[str, Tuple[str, Color, bool, bool]],
@@ -74,15 +237,69 @@ class Renderer:
             x: Координата X.
             y: Координата Y.
         """
-        try:
-            # Проверяем границы экрана
-            if y < 0 or x < 0 or y >= self.height:
-                return
+        self.draw_spans(self.compile_template(template, replacements), x, y)
 
-            self.template_renderer.draw_template(self.stdscr, template, replacements, x, y)
+    def compile_template(self, template: str,
+                         replacements: Dict[str, Tuple[str, Color, bool, bool]]) -> List[Tuple[str, int]]:
+        """
+        Подготовка шаблона к многократной отрисовке через draw_spans.
+
+        Args:
+            template: Шаблон текста с плейсхолдерами %1, %2 и т.д.
+            replacements: Словарь замен {номер: (текст, цвет, жирный, тусклый)}.
+
+        Returns:
+            Список пар (текст, атрибуты curses).
+        """
+        return self.template_renderer.compile_template(template, replacements)
+
+    def draw_spans(self, spans: List[Tuple[str, int]], x: int, y: int) -> None:
+        """
+        Отрисовка подготовленных отрезков текста в одну строку.
+
+        Args:
+            spans: Список пар (текст, атрибуты curses) из compile_template.
+            x: Координата X.
+            y: Координата Y.
+        """
+        if y < 0 or x < 0 or y >= self.height or not spans:
+            return
+        # Методы связываются один раз: цикл выполняется для каждого отрезка строки
+        set_attr, addstr = self._set_attr, self.stdscr.addstr
+        try:
+            self.stdscr.move(y, x)
+            for text, attr in spans:
+                set_attr(attr)
+                addstr(text)
         except curses.error:
+            # Игнорируем ошибки выхода за границы экрана
             pass
 
+    def draw_span_lines(self, lines: Sequence[List[Tuple[str, int]]], x: int, y: int) -> None:
+        """
+        Отрисовка подготовленных строк подряд, по одной на строку экрана.
+
+        Все строки выводятся за один вызов: методы окна связываются один раз,
+        а атрибуты переустанавливаются только при смене цвета между отрезками.
+
+        Args:
+            lines: Строки из отрезков (текст, атрибуты curses), как у draw_spans.
+            x: Координата X.
+            y: Координата Y первой строки.
+        """
+        if x < 0 or x >= self.width:
+            return
+        set_attr, move, addstr = self._set_attr, self.stdscr.move, self.stdscr.addstr
+        for row in range(max(0, -y), min(len(lines), self.height - y)):
+            try:
+                move(y + row, x)
+                for text, attr in lines[row]:
+                    set_attr(attr)
+                    addstr(text)
+            except curses.error:
+                # Запись в правый нижний угол экрана вызывает ошибку после вывода
+                pass
+
     def draw_box(self, x: int, y: int, width: int, height: int) -> None:
         """
         Отрисовка прямоугольника.
@@ -94,6 +311,7 @@ class Renderer:
             height: Высота прямоугольника.
         """
         try:
+            self._set_attr(curses.A_NORMAL)
             # Верхняя и нижняя границы
             if y < self.height and y + height - 1 < self.height:
                 self.stdscr.addstr(y, x, "+" + "-" * (width - 2) + "+")
@@ -118,23 +336,30 @@ class Renderer:
             width: Ширина прямоугольника.
             height: Высота прямоугольника.
         """
-        а = "┬ ┴"
+        # Верхняя и нижняя границы (выход за границы экрана обрабатывает draw_text)
+        top_text, bottom_text = _log_box_edges(width)
 
-        try:
-            # Верхняя и нижняя границы
-            top_text = "├" + "─" * ((width - 3) // 2) + "┴" + "─" * ((width - 3) // 2) + "┤"
-            bottom_text = "└" + "─" * (width - 2) + "┘"
-            
-            self.draw_text(text=top_text, x=x, y=y, color=Color.DEFAULT, dim=True)
-            self.draw_text(text=bottom_text, x=x, y=y + height - 1, color=Color.DEFAULT, dim=True)
-            
-            #if y < self.height and y + height - 1 < self.height:
-                #self.stdscr.addstr(y, x, , curses.get_color_pair(Color.DEFAULT))
-                #self.stdscr.addstr(y + height - 1, x, "└" + "─" * (width - 2) + "┘")
-
-        except curses.error:
-            pass
+        self.draw_text(text=top_text, x=x, y=y, color=Color.DEFAULT, dim=True)
+        self.draw_text(text=bottom_text, x=x, y=y + height - 1, color=Color.DEFAULT, dim=True)
 
     def refresh(self) -> None:
-        """Обновление экрана."""
-        self.stdscr.refresh()
+        """
+        Подготовка обновления экрана.
+
+        Изменения переносятся только в виртуальный экран curses (noutrefresh);
+        на терминал они выводятся одним обновлением в commit().
+        """
+        self.stdscr.noutrefresh()
+        self._update_pending = True
+
+    def commit(self) -> None:
+        """
+        Вывод всех подготовленных изменений на терминал одним обновлением.
+
+        Если с последнего вывода кадр не подготавливался (экран пропустил
+        отрисовку без изменений), обращение к терминалу не выполняется.
+        """
+        if not self._update_pending:
+            return
+        curses.doupdate()
+        self._update_pending = False
@@ -13,6 +13,63 @@ import curses
 from game.ui.rendering.color_manager import Color, ColorManager
 
 
+def clip_spans(spans: List[Tuple[str, int]], width: int) -> List[Tuple[str, int]]:
+    """
+    Обрезка подготовленных отрезков строки до заданной ширины.
+
+    Args:
+        spans: Список пар (текст, атрибуты curses).
+        width: Максимальная ширина строки в символах.
+
+    Returns:
+        Отрезки, суммарная длина которых не превышает width.
+    """
+    clipped: List[Tuple[str, int]] = []
+    remaining = width
+    for text, attr in spans:
+        if remaining <= 0:
+            break
+        if len(text) > remaining:
+            text = text[:remaining]
+        clipped.append((text, attr))
+        remaining -= len(text)
+    return clipped
+
+
+def join_segments(segments: List[Tuple[int, List[Tuple[str, int]]]]) -> List[Tuple[int, List[Tuple[str, int]]]]:
+    """
+    Объединение отрезков одной строки, идущих слева направо, в возможно меньшее число частей.
+
+    Промежутки между соседними частями заполняются пробелами без атрибутов
+    (как после очистки экрана), а соседние отрезки с одинаковыми атрибутами
+    склеиваются, чтобы строка выводилась одним перемещением курсора и
+    минимальным числом вызовов addstr. Перекрывающиеся части не объединяются.
+
+    Args:
+        segments: Список пар (координата X, отрезки (текст, атрибуты curses)).
+
+    Returns:
+        Список пар (координата X, отрезки) с той же выводимой строкой.
+    """
+    joined: List[Tuple[int, List[Tuple[str, int]]]] = []
+    cursor = -1
+    for x, spans in segments:
+        if not joined or x < cursor:
+            current: List[Tuple[str, int]] = []
+            joined.append((x, current))
+            cursor = x
+        elif x > cursor:
+            current.append((" " * (x - cursor), curses.A_NORMAL))
+            cursor = x
+        for text, attr in spans:
+            if current and current[-1][1] == attr:
+                current[-1] = (current[-1][0] + text, attr)
+            else:
+                current.append((text, attr))
+            cursor += len(text)
+    return joined
+
+
 class TemplatePart:
     """Часть шаблона с форматированием."""
 
@@ -86,32 +143,76 @@ class TemplateRenderer:
 
         return parts
 
-    def draw_template(self, stdscr: curses.window, template: str, replacements: Dict[str, Tuple[str, Color, bool, bool]],
-                     x: int, y: int) -> None:
+    def compile_template(self, template: str,
+                         replacements: Dict[str, Tuple[str, Color, bool, bool]]) -> List[Tuple[str, int]]:
         """
-        Отрисовка шаблона на экране.
+        Преобразование шаблона в готовые к выводу отрезки.
+
+        Соседние части с одинаковыми атрибутами объединяются в один отрезок,
+        чтобы выводить их одним вызовом addstr.
 
         Args:
-            stdscr: Окно curses для отрисовки.
             template: Шаблон текста.
             replacements: Словарь замен.
+
+        Returns:
+            Список пар (текст, атрибуты curses).
+        """
+        spans: List[Tuple[str, int]] = []
+        # Тексты текущего отрезка собираются в список и склеиваются одним join
+        # при смене атрибутов, без промежуточных строк на каждую часть
+        run: List[str] = []
+        run_attr = 0
+        for part in self.render_template(template, replacements):
+            if not part.text:
+                continue
+            attr = self.color_manager.get_color_pair(part.color)
+            if part.bold:
+                attr |= curses.A_BOLD
+            if part.dim:
+                attr |= curses.A_DIM
+
+            if run and attr != run_attr:
+                spans.append(("".join(run), run_attr))
+                run = []
+            run.append(part.text)
+            run_attr = attr
+        if run:
+            spans.append(("".join(run), run_attr))
+        return spans
+
+    def draw_spans(self, stdscr: curses.window, spans: List[Tuple[str, int]], x: int, y: int) -> None:
+        """
+        Отрисовка заранее подготовленных отрезков в одну строку.
+
+        Курсор позиционируется один раз, отрезки выводятся подряд с текущей позиции.
+
+        Args:
+            stdscr: Окно curses для отрисовки.
+            spans: Список пар (текст, атрибуты curses).
             x: Координата X.
             y: Координата Y.
         """
+        if y < 0 or x < 0 or not spans:
+            return
         try:
-            parts = self.render_template(template, replacements)
-            current_x = x
-
-            for part in parts:
-                if y >= 0 and current_x >= 0:
-                    attr = self.color_manager.get_color_pair(part.color)
-                    if part.bold:
-                        attr |= curses.A_BOLD
-                    if part.dim:
-                        attr |= curses.A_DIM
-
-                    stdscr.addstr(y, current_x, part.text, attr)
-                    current_x += len(part.text)
+            stdscr.move(y, x)
+            for text, attr in spans:
+                stdscr.addstr(text, attr)
         except curses.error:
             # Игнорируем ошибки выхода за границы экрана
             pass
+
+    def draw_template(self, stdscr: curses.window, template: str, replacements: Dict[str, Tuple[str, Color, bool, bool]],
+                     x: int, y: int) -> None:
+        """
+        Отрисовка шаблона на экране.
+
+        Args:
+            stdscr: Окно curses для отрисовки.
+            template: Шаблон текста.
+            replacements: Словарь замен.
+            x: Координата X.
+            y: Координата Y.
+        """
+        self.draw_spans(stdscr, self.compile_template(template, replacements), x, y)
@@ -33,6 +33,10 @@ class ScreenManager:
         self.game_manager = game_manager # Сохраняем ссылку на GameManager
         self.running = True
 
+        # getch блокируется в ядре до нажатия клавиши (или изменения размера):
+        # цикл не опрашивает ввод и не перерисовывает экран, пока ничего не происходит
+        self.stdscr.timeout(-1)
+
         self.color_manager = ColorManager()
         self.color_manager.initialize(stdscr)
 
@@ -73,6 +77,8 @@ class ScreenManager:
             # Создаем новый экран, передавая ему ссылку на ScreenManager (self)
             new_screen = self.screens[screen_name](self)
             self.screen_stack.append(new_screen)
+            # Новый экран должен начать отрисовку с полностью очищенного терминала
+            self.renderer.invalidate()
         else:
             raise ValueError(f"Неизвестный экран: {screen_name}")
 
@@ -80,6 +86,7 @@ class ScreenManager:
         """Возврат к предыдущему экрану (выход из стека)."""
         if len(self.screen_stack) > 1:
             self.screen_stack.pop()
+            self.renderer.invalidate()
         else:
             self.stop()
 
@@ -123,14 +130,16 @@ class ScreenManager:
             # Отрисовываем текущий экран
             current.render(self.stdscr)
 
-            # Обновляем экран
-            self.stdscr.refresh()
+            # Обновляем экран: одно обновление терминала за кадр
+            self.renderer.refresh()
+            self.renderer.commit()
 
             # Получаем ввод пользователя
             try:
                 key = self.stdscr.getch()
-                # Обрабатываем ввод
-                current.handle_input(key)
+                # ERR означает, что ожидание прервано без ввода (например, сигналом)
+                if key != curses.ERR:
+                    current.handle_input(key)
             except KeyboardInterrupt:
                 self.stop()
             except Exception as e:
@@ -1,6 +1,7 @@
 # game/ui/widgets/bars.py
 """Прогресс-бары для отображения различных параметров (HP, Energy и т.д.)."""
 
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING, Dict, Tuple
 from abc import ABC, abstractmethod
 
@@ -11,10 +12,46 @@ from game.ui.rendering.color_manager import Color
 if TYPE_CHECKING:
     from game.entities.character import Character
 
+# Заранее построенные строки символов прогресс-бара: части бара берутся срезом,
+# без повторения символа при каждой отрисовке. Длиннее MAX_BAR_WIDTH бары не бывают
+MAX_BAR_WIDTH = 256
+FILLED_BAR = "■" * MAX_BAR_WIDTH
+EMPTY_BAR = "□" * MAX_BAR_WIDTH
+
+
+@lru_cache(maxsize=256)
+def _progress_template(filled_count: int, empty_count: int,
+                       fill_color: Color, empty_color: Color) -> Tuple[str, Dict[str, Tuple[str, Color, bool, bool]]]:
+    """
+    Шаблон и словарь замен прогресс-бара для заданного заполнения.
+
+    Различных сочетаний немного (ширина бара на число вариантов заполнения и
+    цветов), поэтому каждое строится один раз. Возвращаемый словарь общий
+    для всех вызовов и не должен изменяться.
+
+    Args:
+        filled_count: Количество заполненных символов.
+        empty_count: Количество пустых символов.
+        fill_color: Цвет заполненной части.
+        empty_color: Цвет пустой части.
+
+    Returns:
+        Кортеж (шаблон, словарь_замен).
+    """
+    # Строки заполнения - срезы готовых строк, ширина ограничена MAX_BAR_WIDTH
+    return "%1%2%3%4", {
+        "1": ("[", Color.WHITE, False, False),                    # Открывающая скобка
+        "2": (FILLED_BAR[:filled_count], fill_color, False, False),  # Заполненная часть
+        "3": (EMPTY_BAR[:empty_count], empty_color, False, False),   # Пустая часть
+        "4": ("]", Color.WHITE, False, False)                     # Закрывающая скобка
+    }
+
 
 class ProgressBar(Renderable, ABC):
     """Базовый класс для отрисовки прогресс-бара с использованием шаблонов."""
 
+    __slots__ = ('width', 'character')
+
     def __init__(
         self,
         x: int = 0,
@@ -79,21 +116,7 @@ class ProgressBar(Renderable, ABC):
         Returns:
             Кортеж (шаблон, словарь_замен).
         """
-        # Создаем строки заполнения
-        filled_part = "■" * filled_count  # Полностью заполненные символы
-        empty_part = "□" * empty_count    # Пустые символы
-
-        # Создаем шаблон
-        template = "%1%2%3%4"
-        
-        replacements = {
-            "1": ("[", Color.WHITE, False, False),      # Открывающая скобка
-            "2": (filled_part, self._get_fill_color(), False, False),  # Заполненная часть
-            "3": (empty_part, self._get_empty_color(), False, False),  # Пустая часть
-            "4": ("]", Color.WHITE, False, False)       # Закрывающая скобка
-        }
-        
-        return template, replacements
+        return _progress_template(filled_count, empty_count, self._get_fill_color(), self._get_empty_color())
 
     def render(self, renderer: Renderer) -> None:
         """Отрисовка прогресс-бара с использованием шаблона."""
@@ -150,6 +173,8 @@ class ProgressBar(Renderable, ABC):
 class HealthBar(ProgressBar):
     """Прогресс-бар для отображения здоровья (HP)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         x: int = 0,
@@ -170,26 +195,24 @@ class HealthBar(ProgressBar):
 
     def _get_current_value(self) -> int:
         """Получить текущее значение HP из персонажа."""
-        if self.character and hasattr(self.character, 'health'):
-            # Получаем текущее HP из свойства health
-            return getattr(self.character.health, 'health', 0)
-        return 0
+        # Свойство health читается с персонажа один раз, без отдельной проверки hasattr
+        health = getattr(self.character, 'health', None)
+        return getattr(health, 'health', 0) if health is not None else 0
 
     def _get_max_value(self) -> int:
         """Получить максимальное значение HP из персонажа."""
-        if self.character and hasattr(self.character, 'health'):
-            # Получаем максимальное HP из свойства health
-            return getattr(self.character.health, 'max_health', 1)
-        return 1
+        health = getattr(self.character, 'health', None)
+        return getattr(health, 'max_health', 1) if health is not None else 1
 
     def _get_fill_color(self) -> Color:
         """Получить цвет заполненной части для HP."""
-        if not self.character or not hasattr(self.character, 'health'):
+        health = getattr(self.character, 'health', None)
+        if health is None:
             return Color.GREEN
             
         # Получаем значения для расчета цвета
-        current = self._get_current_value()
-        max_val = self._get_max_value()
+        current = getattr(health, 'health', 0)
+        max_val = getattr(health, 'max_health', 1)
         
         ratio: float = 0
         if max_val > 0:
@@ -210,6 +233,8 @@ class HealthBar(ProgressBar):
 class EnergyBar(ProgressBar):
     """Прогресс-бар для отображения энергии (Energy/MP)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         x: int = 0,
@@ -230,17 +255,14 @@ class EnergyBar(ProgressBar):
 
     def _get_current_value(self) -> int:
         """Получить текущее значение энергии из персонажа."""
-        if self.character and hasattr(self.character, 'energy'):
-            # Получаем текущую энергию из свойства energy
-            return getattr(self.character.energy, 'energy', 0)
-        return 0
+        # Свойство energy читается с персонажа один раз, без отдельной проверки hasattr
+        energy = getattr(self.character, 'energy', None)
+        return getattr(energy, 'energy', 0) if energy is not None else 0
 
     def _get_max_value(self) -> int:
         """Получить максимальное значение энергии из персонажа."""
-        if self.character and hasattr(self.character, 'energy'):
-            # Получаем максимальную энергию из свойства energy
-            return getattr(self.character.energy, 'max_energy', 0)
-        return 0
+        energy = getattr(self.character, 'energy', None)
+        return getattr(energy, 'max_energy', 0) if energy is not None else 0
 
     def _get_fill_color(self) -> Color:
         """Получить цвет заполненной части для энергии (синий)."""
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class TextLabel(Renderable):
     """Базовая текстовая метка."""
 
+    __slots__ = ('text', 'color', 'bold', 'dim')
+
     def __init__(
         self, 
         x: int = 0, 
@@ -54,6 +56,8 @@ class TextLabel(Renderable):
 class CharacterNameLabel(TextLabel):
     """Метка для отображения имени персонажа."""
 
+    __slots__ = ('character', 'max_width')
+
     def __init__(
         self,
         character: Optional['Character'], 
@@ -97,6 +101,8 @@ class CharacterNameLabel(TextLabel):
 
 class TemplatedTextLabel(TextLabel):
     """Базовая метка для отрисовки текста с использованием шаблонов и цветов."""
+
+    __slots__ = ()
     
     def __init__(self, x: int = 0, y: int = 0) -> None:
         """
@@ -152,6 +158,8 @@ class TemplatedTextLabel(TextLabel):
 class CharacterClassLabel(TemplatedTextLabel):
     """Метка для отображения класса/роли персонажа в формате [Роль]."""
 
+    __slots__ = ('character',)
+
     def __init__(
         self,
         character: Optional['Character'], 
@@ -198,6 +206,8 @@ class CharacterClassLabel(TemplatedTextLabel):
 class CharacterLevelLabel(TemplatedTextLabel):
     """Метка для отображения уровня персонажа в формате [1]."""
 
+    __slots__ = ('character',)
+
     def __init__(
         self,
         character: Optional['Character'], 
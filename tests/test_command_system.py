@@ -1,10 +1,16 @@
 # tests/test_command_system.py
 """Тесты для системы команд."""
 
+import curses
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
 
-from game.ui.command_system.command import Command, CommandRegistry
+from game.ui.command_system.command import KEY_TABLE_SIZE, Command, CommandRegistry
+from game.ui.command_system.screen_command_registry import (
+    SCREEN_COMMANDS,
+    get_screen_commands,
+    register_screen_commands,
+)
 
 
 class CommandTest(Command):
@@ -154,3 +160,171 @@ def test_command_with_int_key_in_registry() -> None:
 
     assert result is True
     assert cmd.executed is True
+
+
+def test_get_screen_commands_sees_registration_after_lookup() -> None:
+    """Тест: кэш команд экрана сбрасывается при регистрации новых команд."""
+
+    class DummyScreen:
+        """Фиктивный класс экрана."""
+
+    try:
+        assert get_screen_commands(DummyScreen) == []  # type: ignore[arg-type]
+
+        cmd = CommandTest()
+        register_screen_commands(DummyScreen, [cmd])  # type: ignore[arg-type]
+
+        assert get_screen_commands(DummyScreen) == [cmd]  # type: ignore[arg-type]
+    finally:
+        SCREEN_COMMANDS.pop(DummyScreen, None)  # type: ignore[call-overload]
+        get_screen_commands.cache_clear()
+
+
+def test_command_registry_display_line_updates_on_register() -> None:
+    """Тест: строка подсказок реестра обновляется при изменении набора команд."""
+    registry = CommandRegistry()
+    registry.register_command(CommandTest(name="Атака", keys=['a']))
+    assert registry.get_display_line() == "a : Атака"
+
+    registry.register_command(CommandTest(name="Выход", keys=['q']))
+    assert registry.get_display_line() == "a : Атака | q : Выход"
+
+    registry.clear()
+    assert registry.get_display_line() == ""
+
+
+def test_get_screen_commands_includes_base_class_commands() -> None:
+    """Тест: экран получает команды, зарегистрированные для его базового класса."""
+
+    class BaseDummyScreen:
+        """Фиктивный базовый класс экрана."""
+
+    class DerivedDummyScreen(BaseDummyScreen):
+        """Фиктивный производный класс экрана."""
+
+    base_cmd = CommandTest(name="Назад", keys=['q'])
+    derived_cmd = CommandTest(name="Атака", keys=['a'])
+    try:
+        register_screen_commands(BaseDummyScreen, [base_cmd])  # type: ignore[arg-type]
+        register_screen_commands(DerivedDummyScreen, [derived_cmd])  # type: ignore[arg-type]
+
+        assert get_screen_commands(DerivedDummyScreen) == [base_cmd, derived_cmd]  # type: ignore[arg-type]
+        assert get_screen_commands(BaseDummyScreen) == [base_cmd]  # type: ignore[arg-type]
+    finally:
+        SCREEN_COMMANDS.pop(BaseDummyScreen, None)  # type: ignore[call-overload]
+        SCREEN_COMMANDS.pop(DerivedDummyScreen, None)  # type: ignore[call-overload]
+        get_screen_commands.cache_clear()
+
+
+def test_registered_command_class_is_instantiated_once() -> None:
+    """Тест: класс команды инстанцируется лениво и один раз для всех экранов."""
+
+    class FirstDummyScreen:
+        """Фиктивный класс экрана."""
+
+    class SecondDummyScreen:
+        """Фиктивный класс экрана."""
+
+    try:
+        register_screen_commands(FirstDummyScreen, [CommandTest])  # type: ignore[arg-type, list-item]
+        register_screen_commands(SecondDummyScreen, [CommandTest])  # type: ignore[arg-type, list-item]
+
+        first = get_screen_commands(FirstDummyScreen)  # type: ignore[arg-type]
+        second = get_screen_commands(SecondDummyScreen)  # type: ignore[arg-type]
+
+        assert len(first) == 1 and isinstance(first[0], CommandTest)
+        assert first[0] is second[0]
+    finally:
+        SCREEN_COMMANDS.pop(FirstDummyScreen, None)  # type: ignore[call-overload]
+        SCREEN_COMMANDS.pop(SecondDummyScreen, None)  # type: ignore[call-overload]
+        get_screen_commands.cache_clear()
+
+
+def test_repeated_registration_keeps_resolved_commands() -> None:
+    """Тест: повторная регистрация того же набора не пересобирает команды экрана."""
+
+    class DummyScreen:
+        """Фиктивный класс экрана."""
+
+    try:
+        register_screen_commands(DummyScreen, [CommandTest])  # type: ignore[arg-type, list-item]
+        resolved = get_screen_commands(DummyScreen)  # type: ignore[arg-type]
+
+        register_screen_commands(DummyScreen, [CommandTest])  # type: ignore[arg-type, list-item]
+
+        assert get_screen_commands(DummyScreen) is resolved  # type: ignore[arg-type]
+    finally:
+        SCREEN_COMMANDS.pop(DummyScreen, None)  # type: ignore[call-overload]
+        get_screen_commands.cache_clear()
+
+
+def test_command_registry_dispatches_keys_outside_table() -> None:
+    """Тест: коды клавиш за пределами таблицы и отрицательные коды обрабатываются корректно."""
+    registry = CommandRegistry()
+    arrow_cmd = CommandTest(name="Вверх", keys=[curses.KEY_UP])
+    far_cmd = CommandTest(name="Далеко", keys=[KEY_TABLE_SIZE + 10])
+    registry.register_command(arrow_cmd)
+    registry.register_command(far_cmd)
+
+    assert registry.get_command_by_key(curses.KEY_UP) is arrow_cmd
+    assert registry.execute_command(KEY_TABLE_SIZE + 10) is True
+    assert far_cmd.executed is True
+    assert registry.execute_command(-1) is False
+
+
+def test_command_registry_clear_removes_key_bindings() -> None:
+    """Тест: после очистки реестра клавиши удаленных команд не выполняются."""
+    registry = CommandRegistry()
+    table_cmd = CommandTest(name="Вверх", keys=[curses.KEY_UP])
+    far_cmd = CommandTest(name="Далеко", keys=[KEY_TABLE_SIZE + 10])
+    registry.register_command(table_cmd)
+    registry.register_command(far_cmd)
+
+    registry.clear()
+
+    assert registry.get_all_commands() == []
+    assert registry.get_command_by_key(curses.KEY_UP) is None
+    assert registry.get_command_by_key(KEY_TABLE_SIZE + 10) is None
+    assert registry.execute_command(curses.KEY_UP) is False
+    assert table_cmd.executed is False
+
+
+def test_scroll_log_commands_scroll_only_the_log() -> None:
+    """Тест: команды прокрутки двигают лог и не требуют перерисовки всего экрана."""
+    from game.ui.commands.battle_commands import ScrollLogDownCommand, ScrollLogUpCommand
+
+    context = MagicMock()
+    registry = CommandRegistry()
+    registry.register_command(ScrollLogUpCommand())
+    registry.register_command(ScrollLogDownCommand())
+
+    assert registry.execute_command(curses.KEY_UP, context) is True
+    assert registry.execute_command(curses.KEY_DOWN, context) is True
+
+    context.event_log.scroll_up.assert_called_once()
+    context.event_log.scroll_down.assert_called_once()
+    assert not registry.get_command_by_key(curses.KEY_UP).redraws_screen  # type: ignore[union-attr]
+
+
+def test_scroll_log_commands_survive_state_change() -> None:
+    """Тест: после смены состояния экрана боя команды прокрутки остаются в подвале и работают."""
+    from game.ui.commands.battle_commands import ScrollLogUpCommand
+    from game.ui.encounter_screen import EncounterScreen
+
+    # Экран без __init__: проверяется только перестройка набора команд
+    screen = EncounterScreen.__new__(EncounterScreen)
+    screen.manager = MagicMock()
+    screen.command_registry = CommandRegistry()
+    screen.state = "VICTORY"
+
+    screen._reset_commands()
+
+    commands = screen.command_registry.get_all_commands()
+    assert any(isinstance(command, ScrollLogUpCommand) for command in commands)
+    assert "↑ : Лог вверх" in screen.command_registry.get_display_line()
+
+    context = MagicMock()
+    assert screen.command_registry.execute_command(curses.KEY_UP, context) is True
+    context.event_log.scroll_up.assert_called_once()
+    # Enter остается за командой состояния, а не за боевой командой атаки
+    assert screen.command_registry.get_command_by_key(10).name == "Продолжить"  # type: ignore[union-attr]
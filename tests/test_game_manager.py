@@ -52,3 +52,19 @@ class TestGameManager:
         # Проверки
         assert player_group == [mock_player1, mock_player2]
         assert len(player_group) == 2
+
+    def test_get_player_group_reuses_copy_until_group_changes(self) -> None:
+        """
+        Тест: Метод get_player_group не копирует группу повторно, пока состав не изменился.
+        """
+        manager = get_game_manager()
+        manager.player_group = [MagicMock()]
+
+        first = manager.get_player_group()
+        assert manager.get_player_group() is first
+        assert first is not manager.player_group
+
+        new_player = MagicMock()
+        manager.player_group = [new_player]
+
+        assert manager.get_player_group() == [new_player]
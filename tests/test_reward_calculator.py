@@ -0,0 +1,91 @@
+# tests/test_reward_calculator.py
+"""Тесты для калькулятора наград."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from game.events.reward_events import PartyExperienceGainedEvent, RewardExperienceGainedEvent
+from game.rewards.types import ExperienceReward
+from game.systems.battle.result import BattleResult
+from game.systems.rewards.calculator import RewardCalculator
+
+
+def _make_recipient(name: str) -> MagicMock:
+    """Создает мок-персонажа, получающего опыт."""
+    character = MagicMock()
+    character.name = name
+    return character
+
+
+def test_distribute_total_experience_preserves_total() -> None:
+    """Разброс опыта не должен терять или добавлять очки опыта."""
+    context = MagicMock()
+    calculator = RewardCalculator(context)
+    recipients = [_make_recipient(name) for name in ("A", "B", "C", "D")]
+
+    calculator._distribute_total_experience(1003, recipients)
+
+    party_events = [
+        call.args[0] for call in context.event_bus.publish.call_args_list
+        if isinstance(call.args[0], PartyExperienceGainedEvent)
+    ]
+    assert len(party_events) == 1
+    event = party_events[0]
+    assert event.total_experience == 1003
+    assert sum(amount for _, amount in event.recipients_and_amounts) == 1003
+
+
+def test_distribute_total_experience_no_recipients() -> None:
+    """Без получателей событие не публикуется."""
+    context = MagicMock()
+    calculator = RewardCalculator(context)
+
+    calculator._distribute_total_experience(100, [])
+
+    context.event_bus.publish.assert_not_called()
+
+
+def test_experience_reward_apply_many_publishes_per_recipient() -> None:
+    """apply_many публикует событие опыта от имени каждого персонажа."""
+    first, second = _make_recipient("A"), _make_recipient("B")
+
+    ExperienceReward.apply_many([(first, 5), (second, 7)])
+
+    for recipient, amount in ((first, 5), (second, 7)):
+        event = recipient.context.event_bus.publish.call_args.args[0]
+        assert isinstance(event, RewardExperienceGainedEvent)
+        assert event.source is recipient
+        assert event.amount == amount
+
+
+def test_experience_reward_apply_many_rejects_batch_before_publishing() -> None:
+    """apply_many не публикует ни одного события, если в списке есть отрицательный опыт."""
+    first, second, third = _make_recipient("A"), _make_recipient("B"), _make_recipient("C")
+
+    with pytest.raises(ValueError):
+        ExperienceReward.apply_many([(first, 5), (second, -1), (third, 7)])
+
+    for recipient in (first, second, third):
+        recipient.context.event_bus.publish.assert_not_called()
+
+
+def test_calculate_and_distribute_sums_enemy_rewards() -> None:
+    """Опыт от всех побежденных врагов суммируется и распределяется."""
+    context = MagicMock()
+    calculator = RewardCalculator(context)
+    players = [_make_recipient("A"), _make_recipient("B")]
+    enemies = []
+    for exp in (10, 25, 40):
+        enemy = MagicMock()
+        enemy.reward_exp = exp
+        enemy.level.get_level.return_value = 1
+        enemies.append(enemy)
+
+    calculator.calculate_and_distribute(BattleResult(
+        players=players, enemies=enemies, alive_players=players, dead_enemies=enemies
+    ))
+
+    event = context.event_bus.publish.call_args.args[0]
+    assert isinstance(event, PartyExperienceGainedEvent)
+    assert event.total_experience == 75
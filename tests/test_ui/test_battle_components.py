@@ -0,0 +1,338 @@
+# tests/test_ui/test_battle_components.py
+"""Тесты для компонентов экрана боя."""
+
+import curses
+from unittest.mock import MagicMock, patch
+
+from game.events.render_data import RenderData
+from game.ui.components.battle_components import BattleLog, EnemyGroupPanel, PlayerGroupPanel, PlayerUnitPanel
+from game.ui.rendering.color_manager import Color
+from game.ui.widgets.labels import CharacterClassLabel
+
+
+class TestGroupPanel:
+    """Тесты для панелей групп."""
+
+    def test_update_players_same_group_keeps_panels(self) -> None:
+        """Тест: панели не пересоздаются, если состав группы не изменился."""
+        players = [MagicMock(), MagicMock()]
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=players)
+        panels = list(group.panels)
+
+        group.update_players(list(players))
+
+        assert group.panels == panels
+        assert all(old is new for old, new in zip(panels, group.panels))
+
+    def test_update_enemies_new_group_rebuilds_panels(self) -> None:
+        """Тест: при смене состава группы панели перестраиваются."""
+        enemies = [MagicMock()]
+        group = EnemyGroupPanel(x=0, y=0, width=40, height=5, enemies=enemies)
+
+        new_enemies = [MagicMock(), MagicMock()]
+        group.update_enemies(new_enemies)
+
+        assert len(group.panels) == 2
+        assert [panel.character for panel in group.panels] == new_enemies
+
+    def test_group_change_reuses_panels_of_remaining_units(self) -> None:
+        """Тест: при смене состава группы панели оставшихся юнитов переиспользуются."""
+        survivor, fallen = MagicMock(), MagicMock()
+        group = EnemyGroupPanel(x=0, y=3, width=40, height=5, enemies=[fallen, survivor])
+        survivor_panel = group.panels[1]
+
+        summoned = MagicMock()
+        assert group.update_enemies([survivor, summoned])
+
+        assert group.panels[0] is survivor_panel
+        assert survivor_panel.y == 3
+        assert group.panels[1].character is summoned
+
+    def test_new_unit_takes_panel_of_fallen_unit(self) -> None:
+        """Тест: новый юнит получает панель выбывшего вместо создания новой."""
+        fallen = MagicMock()
+        group = EnemyGroupPanel(x=0, y=0, width=40, height=5, enemies=[fallen])
+        fallen_panel = group.panels[0]
+
+        summoned = MagicMock()
+        summoned.name = "Призрак"
+        summoned.is_player = False
+        group.update_enemies([summoned])
+
+        assert group.panels[0] is fallen_panel
+        assert fallen_panel.character is summoned
+        assert fallen_panel.hp_label.character is summoned
+        assert fallen_panel.name_label.text == "Призрак"
+
+    def test_set_geometry_unchanged_keeps_panels(self) -> None:
+        """Тест: повторная установка той же геометрии не перестраивает панели."""
+        group = PlayerGroupPanel(x=1, y=2, width=40, height=5, players=[MagicMock()])
+        panels = group.panels
+
+        assert not group.set_geometry(1, 2, 40, 5)
+        assert group.panels is panels
+
+        assert group.set_geometry(1, 2, 30, 5)
+        assert group.panels is not panels
+        assert group.panels[0].width == 30
+
+    def test_update_size_skips_panels_already_sized(self) -> None:
+        """Тест: панели юнитов нужной ширины не пересчитываются повторно."""
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[MagicMock(), MagicMock()])
+        group.update_size(80, 24)
+        assert group.panels[0].width == 20
+
+        with patch.object(PlayerUnitPanel, '_update_widgets_positions') as update_positions:
+            group.update_size(80, 24)
+
+        update_positions.assert_not_called()
+
+    def test_hp_change_marks_group_dirty(self) -> None:
+        """Тест: изменение HP юнита требует перерисовки панели группы."""
+        player = MagicMock()
+        player.health.health = 10
+        player.health.max_health = 10
+        player.energy.energy = 5
+        player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[player])
+        group.render(MagicMock())
+        assert not group.dirty
+
+        player.health.health = 4
+
+        assert group.dirty
+
+    def test_render_changed_redraws_only_changed_unit_row(self) -> None:
+        """Тест: при изменении одного юнита перерисовывается только его строка."""
+        players = [MagicMock(), MagicMock()]
+        for player in players:
+            player.health.health = player.health.max_health = 10
+            player.energy.energy = player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=2, width=40, height=5, players=players)
+        group.render(MagicMock())
+
+        players[1].health.health = 4
+        renderer = MagicMock()
+        group.render_changed(renderer)
+
+        renderer.clear_region.assert_called_once_with(0, 3, 40, 1)
+        assert not group.dirty
+
+    def test_render_changed_without_changes_draws_nothing(self) -> None:
+        """Тест: если ни один юнит не изменился, строки группы не перерисовываются."""
+        player = MagicMock()
+        player.health.health = player.health.max_health = 10
+        player.energy.energy = player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=2, width=40, height=5, players=[player])
+        group.render(MagicMock())
+
+        renderer = MagicMock()
+        with patch.object(PlayerUnitPanel, 'render_with_snapshot') as render_unit:
+            group.render_changed(renderer)
+
+        render_unit.assert_not_called()
+        renderer.clear_region.assert_not_called()
+
+    def test_unit_line_recompiled_only_when_stats_change(self) -> None:
+        """Тест: строка юнита разбирается заново только после изменения его данных."""
+        player = MagicMock()
+        player.health.health = 10
+        player.health.max_health = 10
+        player.energy.energy = 5
+        player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[player])
+        renderer = MagicMock()
+
+        group.render(renderer)
+        compiled = renderer.compile_template.call_count
+        group.render(renderer)
+        assert renderer.compile_template.call_count == compiled
+
+        player.health.health = 4
+        group.render(renderer)
+        assert renderer.compile_template.call_count > compiled
+
+    def test_snapshot_without_properties_falls_back_to_defaults(self) -> None:
+        """Тест: снимок юнита без свойств здоровья и энергии строится без ошибок."""
+        player = MagicMock()
+        player.health = None
+        player.energy = None
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[player])
+        group.render(MagicMock())
+
+        assert not group.dirty
+        assert group.panels[0].snapshot()[-4:] == (0, 1, 0, 0)
+
+    def test_group_render_reads_each_unit_once(self) -> None:
+        """Тест: при отрисовке группы снимок каждого юнита строится один раз."""
+        players = [MagicMock(), MagicMock()]
+        for player in players:
+            player.health.health = player.health.max_health = 10
+            player.energy.energy = player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=players)
+
+        with patch.object(PlayerUnitPanel, 'snapshot', autospec=True, return_value=(0,)) as snapshot:
+            group.render(MagicMock())
+
+        assert sorted(call.args[0].y for call in snapshot.call_args_list) == [0, 1]
+
+    def test_unit_line_drawn_with_single_call(self) -> None:
+        """Тест: строка юнита выводится одним вызовом draw_spans с заполненными промежутками."""
+        player = MagicMock()
+        player.name = "Лис"
+        player.class_icon, player.class_icon_color = "В", ""
+        player.level.level = 1
+        player.health.health = player.health.max_health = 10
+        player.energy.energy = player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[player])
+        renderer = MagicMock()
+        renderer.compile_template.side_effect = lambda template, replacements: [
+            ("".join(part[0] for part in replacements.values()), 1)
+        ]
+
+        group.render(renderer)
+
+        renderer.draw_spans.assert_called_once()
+        spans, x, _ = renderer.draw_spans.call_args.args
+        assert x == 0
+        # Имя занимает 6 позиций и отступ: промежуток до класса заполнен пробелами
+        assert spans[:2] == [("Лис", 1), ("    ", curses.A_NORMAL)]
+        # Остальные виджеты идут вплотную и с одинаковыми атрибутами склеиваются в один отрезок
+        assert len(spans) == 3 and spans[2][0].startswith("[В][1][■")
+
+    def test_dirty_check_does_not_update_labels(self) -> None:
+        """Тест: проверка изменений не обновляет метки юнита из персонажа."""
+        player = MagicMock()
+        player.health.health = 10
+        player.health.max_health = 10
+        player.energy.energy = 5
+        player.energy.max_energy = 5
+        group = PlayerGroupPanel(x=0, y=0, width=40, height=5, players=[player])
+        group.render(MagicMock())
+
+        with patch.object(CharacterClassLabel, '_update_from_character') as update_label:
+            assert not group.dirty
+
+        update_label.assert_not_called()
+
+
+def _message(text: str) -> RenderData:
+    """Создает простое сообщение для лога."""
+    return RenderData(template="%1", replacements={"1": (text, Color.DEFAULT, False, False)})
+
+
+class TestBattleLog:
+    """Тесты для лога боя."""
+
+    def test_dirty_cleared_after_render(self) -> None:
+        """Тест: после отрисовки лог перестает быть «грязным»."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        assert log.dirty
+
+        log.render(MagicMock())
+
+        assert not log.dirty
+
+    def test_add_message_marks_dirty(self) -> None:
+        """Тест: новое сообщение требует перерисовки."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        log.render(MagicMock())
+
+        log.add_message(_message("удар"))
+
+        assert log.dirty
+
+    def test_scroll_without_change_keeps_clean(self) -> None:
+        """Тест: прокрутка без изменения смещения не требует перерисовки."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        log.add_message(_message("удар"))
+        log.render(MagicMock())
+
+        log.scroll_down()
+
+        assert not log.dirty
+
+    def test_geometry_change_marks_dirty(self) -> None:
+        """Тест: изменение размеров лога требует перерисовки."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        log.render(MagicMock())
+
+        log.height = 7
+
+        assert log.dirty
+
+    def test_scroll_renders_only_exposed_row(self) -> None:
+        """Тест: после прокрутки выводится только открывшаяся строка."""
+        log = BattleLog(x=0, y=10, width=20, height=5)
+        for i in range(6):
+            log.add_message(_message(f"сообщение {i}"))
+        log.render(MagicMock())
+
+        log.scroll_up()
+        assert log.dirty
+        assert log.can_render_scroll
+
+        renderer = MagicMock()
+        log.render_scroll(renderer)
+
+        renderer.scroll_rows.assert_called_once_with(11, 13, -1)
+        renderer.draw_span_lines.assert_called_once()
+        assert renderer.draw_span_lines.call_args.args[2] == 11
+        assert renderer.compile_template.call_args.args[1]["1"][0] == "сообщение 2"
+        assert not log.dirty
+
+    def test_appended_message_renders_only_new_row(self) -> None:
+        """Тест: новое сообщение в заполненном логе сдвигает строки и выводит одну строку."""
+        log = BattleLog(x=0, y=10, width=20, height=5)
+        for i in range(3):
+            log.add_message(_message(f"сообщение {i}"))
+        log.render(MagicMock())
+
+        log.add_message(_message("сообщение 3"))
+        assert log.dirty
+        assert log.can_render_scroll
+
+        renderer = MagicMock()
+        log.render_scroll(renderer)
+
+        renderer.scroll_rows.assert_called_once_with(11, 13, 1)
+        renderer.draw_span_lines.assert_called_once()
+        assert renderer.draw_span_lines.call_args.args[2] == 13
+        assert renderer.compile_template.call_args.args[1]["1"][0] == "сообщение 3"
+        assert not log.dirty
+
+    def test_long_message_clipped_to_content_width(self) -> None:
+        """Тест: строка сообщения обрезается по ширине содержимого лога."""
+        log = BattleLog(x=0, y=0, width=9, height=5)
+        log.add_message(_message("очень длинное сообщение"))
+        renderer = MagicMock()
+        renderer.compile_template.return_value = [("очень ", 1), ("длинное сообщение", 2)]
+
+        log.render(renderer)
+
+        assert renderer.draw_span_lines.call_args.args[0] == [[("очень ", 1), ("д", 2)]]
+
+    def test_full_redraw_reuses_visible_lines(self) -> None:
+        """Тест: повторная полная отрисовка без изменений лога не собирает строки заново."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        log.add_message(_message("удар"))
+        renderer = MagicMock()
+        log.render(renderer)
+        first_lines = renderer.draw_span_lines.call_args.args[0]
+
+        log.render(renderer)
+
+        assert renderer.draw_span_lines.call_args.args[0] is first_lines
+
+        log.add_message(_message("еще удар"))
+        log.render(renderer)
+        assert len(renderer.draw_span_lines.call_args.args[0]) == 2
+
+    def test_old_messages_evicted_beyond_limit(self) -> None:
+        """Тест: лог хранит не больше MAX_MESSAGES последних сообщений."""
+        log = BattleLog(x=0, y=0, width=20, height=5)
+        for i in range(BattleLog.MAX_MESSAGES + 3):
+            log.add_message(_message(f"сообщение {i}"))
+
+        assert len(log.messages) == BattleLog.MAX_MESSAGES
+        assert log.messages[0].replacements["1"][0] == "сообщение 3"
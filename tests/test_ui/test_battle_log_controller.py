@@ -0,0 +1,31 @@
+# tests/test_ui/test_battle_log_controller.py
+"""Тесты для контроллера лога боя."""
+
+import ast
+from pathlib import Path
+from typing import Set
+
+from game.ui.controllers.battle_log_controller import BattleLogController
+
+GAME_DIR = Path(__file__).resolve().parents[2] / "game"
+
+
+def _event_types_published_with_render_data() -> Set[str]:
+    """Имена классов, которые код игры создает с аргументом render_data."""
+    names: Set[str] = set()
+    for path in GAME_DIR.rglob("*.py"):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and any(keyword.arg == "render_data" for keyword in node.keywords)):
+                names.add(node.func.id)
+    return names
+
+
+def test_controller_subscribes_to_every_event_with_render_data() -> None:
+    """Тест: контроллер подписан на все типы событий, которые публикуются с сообщением для лога."""
+    published = _event_types_published_with_render_data()
+    subscribed = {event_type.__name__ for event_type in BattleLogController._EVENT_TYPES}
+
+    assert published, "не найдено ни одного события с render_data"
+    assert published <= subscribed, f"не подписаны: {sorted(published - subscribed)}"